@@ -4,35 +4,111 @@ Comprehensive AVI Metadata Analyzer
 Shows ALL possible date fields from every source to identify what Windows File Explorer reads
 """
 
+import argparse
+import asyncio
+import glob
+import hashlib
 import json
+import mmap
+import multiprocessing.util
 import os
-import subprocess
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
+from typing import List, Optional, Tuple
 
+try:
+    import exiftool
+except ImportError:
+    exiftool = None
 
-def analyze_avi_metadata(file_path):
-    """Analyze all possible metadata sources for an AVI file."""
-    file_path = Path(file_path)
+from avi_riff_utils import walk_riff_chunks
 
-    print(f"🎯 COMPREHENSIVE AVI METADATA ANALYSIS")
-    print(f"📁 File: {file_path}")
-    print(f"📊 File Size: {file_path.stat().st_size:,} bytes")
-    print("=" * 80)
+# Metadata keys that look date related (MediaInfo also has "mastered_date" etc.)
+_DATE_KEY_PATTERN = re.compile("date|time|create|record|origin")
+_MEDIAINFO_DATE_KEY_PATTERN = re.compile("date|time|create|record|origin|master")
+
+# RIFF chunks reported by the raw inspection
+_REPORTED_CHUNK_IDS = {
+    b"IDIT",  # Digitization time
+    b"ICRD",  # Creation date
+    b"ISFT",  # Software
+    b"LIST",  # List chunk (hdrl, INFO, ...)
+}
+
+# Byte translation table that keeps printable ASCII and masks everything else
+_PRINTABLE_BYTES = bytes(byte if 32 <= byte <= 126 else ord(".") for byte in range(256))
+
+# ExifTool tags that change without the file's size or mtime changing; they
+# are not cached but read from a fresh stat() when the report is built
+_VOLATILE_EXIFTOOL_TAGS = {
+    "File:FileAccessDate": "st_atime",
+    "File:FileInodeChangeDate": "st_ctime",
+}
+
+# Default location of the persistent ffprobe/ExifTool output cache
+DEFAULT_CACHE_DIRECTORY = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "avi-metadata-analyzer"
+)
+
+# State owned by the current pool worker process (see _init_analysis_worker)
+_worker_exiftool_helper = None
+_worker_cache_directory: Optional[Path] = None
+
+
+def _start_exiftool_session():
+    """
+    Start a persistent ExifTool process (``-stay_open``) if pyexiftool is available.
+
+    Returns:
+        Context manager yielding an ExifToolHelper, or yielding None if ExifTool
+        cannot be used (the analyzer then falls back to one subprocess per file)
+    """
+    if not exiftool:
+        return nullcontext()
 
-    # 1. FILE SYSTEM TIMESTAMPS
-    print("\n📅 1. FILE SYSTEM TIMESTAMPS:")
     try:
-        stat = file_path.stat()
-        print(f"   📝 Creation Time:     {datetime.fromtimestamp(stat.st_ctime)}")
-        print(f"   ✏️  Modification Time: {datetime.fromtimestamp(stat.st_mtime)}")
-        print(f"   👁️  Access Time:      {datetime.fromtimestamp(stat.st_atime)}")
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
+        return exiftool.ExifToolHelper()
+    except Exception:
+        return nullcontext()
 
-    # 2. FFPROBE - ALL METADATA
-    print("\n🎬 2. FFPROBE - ALL METADATA:")
+
+async def _run_command(cmd: List[str]) -> Tuple[int, str, str]:
+    """
+    Run an external tool without blocking the event loop.
+
+    Returns:
+        Tuple of (return_code, stdout, stderr)
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=30)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+
+    return (
+        process.returncode,
+        stdout.decode("utf-8", errors="replace"),
+        stderr.decode("utf-8", errors="replace"),
+    )
+
+
+async def _run_ffprobe(file_path: Path):
+    """
+    Run ffprobe once and parse its JSON output.
+
+    Returns:
+        Tuple of (output, succeeded) where output is (parsed_json, None) on
+        success or (None, error_message)
+    """
     try:
         cmd = [
             "ffprobe",
@@ -40,125 +116,380 @@ def analyze_avi_metadata(file_path):
             "quiet",
             "-print_format",
             "json",
-            "-show_format",
-            "-show_streams",
+            # Only the fields the report uses: tags and each stream's type
+            "-show_entries",
+            "format_tags:stream=codec_type:stream_tags",
             str(file_path),
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-
-            # Format metadata
-            if "format" in data and "tags" in data["format"]:
-                print("   📦 FORMAT TAGS:")
-                for key, value in data["format"]["tags"].items():
-                    if any(
-                        date_word in key.lower()
-                        for date_word in ["date", "time", "create", "record", "origin"]
-                    ):
-                        print(f"      🏷️  {key}: {value}")
-
-            # Stream metadata
-            if "streams" in data:
-                for i, stream in enumerate(data["streams"]):
-                    if "tags" in stream:
-                        print(
-                            f"   🎞️  STREAM {i} TAGS ({stream.get('codec_type', 'unknown')}):"
-                        )
-                        for key, value in stream["tags"].items():
-                            if any(
-                                date_word in key.lower()
-                                for date_word in [
-                                    "date",
-                                    "time",
-                                    "create",
-                                    "record",
-                                    "origin",
-                                ]
-                            ):
-                                print(f"      🏷️  {key}: {value}")
-        else:
-            print(f"   ❌ FFprobe failed: {result.stderr}")
+        returncode, stdout, stderr = await _run_command(cmd)
+        if returncode == 0:
+            return (json.loads(stdout), None), True
+        return (None, f"FFprobe failed: {stderr}"), False
+    except asyncio.TimeoutError:
+        return (None, "Error: ffprobe timed out"), False
     except Exception as e:
-        print(f"   ❌ Error: {e}")
+        return (None, f"Error: {e}"), False
 
-    # 3. FFPROBE - FORMAT TAGS ONLY
-    print("\n🏷️  3. FFPROBE - FORMAT TAGS (CSV):")
+
+def _exiftool_helper_time_tags(exiftool_helper, file_path):
+    """Read ExifTool time tags through a running ExifToolHelper."""
     try:
-        cmd = [
+        for tags in exiftool_helper.get_tags([str(file_path)], tags=["Time:All"]):
+            return _cacheable_exiftool_tags(tags), True
+    except Exception as e:
+        return (None, f"❌ Error: {e}"), False
+
+    return ({}, None), True
+
+
+def _cacheable_exiftool_tags(tags: dict):
+    """
+    Drop the source file name and blank out the volatile tags.
+
+    The volatile tags keep their place so the report lists them in ExifTool's
+    order, but their values are filled in from the file when reported.
+
+    Returns:
+        Tuple of (tags, None) in the same shape as the ffprobe output
+    """
+    return (
+        {
+            key: None if key in _VOLATILE_EXIFTOOL_TAGS else value
+            for key, value in tags.items()
+            if key != "SourceFile"
+        },
+        None,
+    )
+
+
+async def _run_exiftool(file_path, exiftool_helper):
+    """
+    Read ExifTool time tags, spawning a one-off exiftool process if needed.
+
+    Both ways ask for group-prefixed tag names (``File:FileModifyDate``) so
+    their output, and any cached copy of it, looks the same.
+
+    Returns:
+        Tuple of (output, succeeded) where output is (tags, None) on success
+        or (None, error_message)
+    """
+    if exiftool_helper is not None:
+        # The helper talks to ExifTool synchronously, so keep it off the loop
+        return await asyncio.to_thread(
+            _exiftool_helper_time_tags, exiftool_helper, file_path
+        )
+
+    try:
+        # Same options ExifToolHelper uses (-G -n), with JSON output
+        cmd = ["exiftool", "-j", "-G", "-n", "-time:all", str(file_path)]
+        returncode, stdout, _ = await _run_command(cmd)
+        if returncode != 0:
+            return (None, "❌ ExifTool not available or failed"), False
+
+        tags_per_file = json.loads(stdout)
+        return _cacheable_exiftool_tags(tags_per_file[0] if tags_per_file else {}), True
+    except FileNotFoundError:
+        return (None, "⚠️  ExifTool not installed"), False
+    except asyncio.TimeoutError:
+        return (None, "❌ Error: exiftool timed out"), False
+    except Exception as e:
+        return (None, f"❌ Error: {e}"), False
+
+
+def _format_exiftool_date(timestamp: float) -> str:
+    """Format a timestamp the way ExifTool prints file dates."""
+    local_time = datetime.fromtimestamp(timestamp).astimezone()
+    utc_offset = local_time.strftime("%z")
+    return f"{local_time:%Y:%m:%d %H:%M:%S}{utc_offset[:3]}:{utc_offset[3:]}"
+
+
+def _exiftool_report_lines(exiftool_tags: dict, file_path: Path) -> List[str]:
+    """Render ExifTool tags, reading the volatile file dates fresh."""
+    report_lines = []
+    file_stat = None
+    for key, value in exiftool_tags.items():
+        if key in _VOLATILE_EXIFTOOL_TAGS:
+            if file_stat is None:
+                file_stat = file_path.stat()
+            value = _format_exiftool_date(
+                getattr(file_stat, _VOLATILE_EXIFTOOL_TAGS[key])
+            )
+        report_lines.append(f"   📅 {key}: {value}")
+    return report_lines
+
+
+def _tool_cache_file(
+    cache_directory: Path, tool_name: str, file_path: Path, file_stat
+) -> Path:
+    """Cache file for one tool's output on one version of a file."""
+    cache_key = (
+        f"{tool_name}:{file_path.resolve()}:{file_stat.st_mtime_ns}:{file_stat.st_size}"
+    )
+    digest = hashlib.blake2b(cache_key.encode("utf-8"), digest_size=16).hexdigest()
+    return cache_directory / f"{digest}.json"
+
+
+async def _cached_tool_output(
+    cache_directory: Optional[Path],
+    tool_name: str,
+    file_path: Path,
+    file_stat,
+    run_tool,
+):
+    """
+    Return a tool's output from the persistent cache, running the tool on a miss.
+
+    Only successful runs are stored, so a tool that is installed later (or a
+    transient failure) is retried on the next run. The file's modification
+    time and size are part of the key, so edited files are analyzed again.
+    """
+    cache_file = None
+    if cache_directory is not None:
+        cache_file = _tool_cache_file(cache_directory, tool_name, file_path, file_stat)
+        try:
+            return json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+
+    output, succeeded = await run_tool()
+
+    if cache_file is not None and succeeded:
+        try:
+            cache_directory.mkdir(parents=True, exist_ok=True)
+            # Write then rename so parallel workers never read a partial entry
+            temporary_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            temporary_file.write_text(json.dumps(output), encoding="utf-8")
+            os.replace(temporary_file, cache_file)
+        except OSError:
+            pass
+
+    return output
+
+
+async def _run_external_tools(
+    file_path: Path, exiftool_helper, cache_directory: Optional[Path]
+):
+    """
+    Run ffprobe and ExifTool for a file concurrently.
+
+    Returns:
+        Tuple of ((ffprobe_data, ffprobe_error), (exiftool_tags, exiftool_error))
+    """
+    file_stat = file_path.stat()
+    return await asyncio.gather(
+        _cached_tool_output(
+            cache_directory,
             "ffprobe",
-            "-v",
-            "quiet",
-            "-show_entries",
-            "format_tags",
-            "-of",
-            "csv=p=0",
-            str(file_path),
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            print(f"   📋 Raw output: {result.stdout.strip()}")
-        else:
-            print(f"   ❌ Error: {result.stderr}")
+            file_path,
+            file_stat,
+            lambda: _run_ffprobe(file_path),
+        ),
+        _cached_tool_output(
+            cache_directory,
+            # Entries hold tags, not report lines (older entries are ignored)
+            "exiftool-tags",
+            file_path,
+            file_stat,
+            lambda: _run_exiftool(file_path, exiftool_helper),
+        ),
+    )
+
+
+def _init_analysis_worker(cache_directory: Optional[Path]):
+    """Start the ExifTool process that a pool worker reuses for all its files."""
+    global _worker_exiftool_helper, _worker_cache_directory
+    _worker_cache_directory = cache_directory
+    exiftool_session = _start_exiftool_session()
+    try:
+        _worker_exiftool_helper = exiftool_session.__enter__()
+    except Exception:
+        _worker_exiftool_helper = None
+        return
+
+    # Pool workers leave through os._exit, which skips atexit handlers, but
+    # multiprocessing runs its finalizers first; this stops the -stay_open
+    # ExifTool process cleanly instead of leaving it to die with the pool
+    multiprocessing.util.Finalize(
+        None, exiftool_session.__exit__, args=(None, None, None), exitpriority=10
+    )
+
+
+def _analyze_to_text(file_path) -> str:
+    """Run the analysis in a pool worker and return the report as text."""
+    return format_avi_metadata_report(
+        file_path, _worker_exiftool_helper, _worker_cache_directory
+    )
+
+
+def analyze_avi_files(
+    file_paths,
+    max_workers: Optional[int] = None,
+    cache_directory: Optional[Path] = None,
+):
+    """
+    Analyze several AVI files.
+
+    Files are analyzed in parallel worker processes, each keeping its own
+    ExifTool process. Reports are printed whole and in input order so the
+    output of different files never interleaves.
+
+    Args:
+        file_paths: Paths of the AVI files to analyze
+        max_workers: Number of worker processes (defaults to cpu_count + 4, max 32)
+        cache_directory: Where to keep ffprobe/ExifTool output between runs
+            (None disables the persistent cache)
+    """
+    file_paths = list(file_paths)
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) + 4)
+
+    if len(file_paths) <= 1 or max_workers <= 1:
+        with _start_exiftool_session() as exiftool_helper:
+            for file_path in file_paths:
+                analyze_avi_metadata(file_path, exiftool_helper, cache_directory)
+                print()
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(file_paths)),
+        initializer=_init_analysis_worker,
+        initargs=(cache_directory,),
+    ) as executor:
+        for report in executor.map(_analyze_to_text, file_paths):
+            sys.stdout.write(report + "\n")
+
+
+def analyze_avi_metadata(file_path, exiftool_helper=None, cache_directory=None):
+    """
+    Analyze all possible metadata sources for an AVI file.
+
+    Args:
+        file_path: Path to the AVI file
+        exiftool_helper: Optional running ExifToolHelper to reuse between files
+        cache_directory: Optional directory of cached ffprobe/ExifTool output
+    """
+    # Write the whole report at once instead of flushing it line by line
+    sys.stdout.write(
+        format_avi_metadata_report(file_path, exiftool_helper, cache_directory)
+    )
+
+
+def format_avi_metadata_report(
+    file_path, exiftool_helper=None, cache_directory=None
+) -> str:
+    """
+    Build the metadata analysis report for an AVI file.
+
+    Args:
+        file_path: Path to the AVI file
+        exiftool_helper: Optional running ExifToolHelper to reuse between files
+        cache_directory: Optional directory of cached ffprobe/ExifTool output
+
+    Returns:
+        The complete report text
+    """
+    file_path = Path(file_path)
+    report_lines = []
+
+    report_lines.append(f"🎯 COMPREHENSIVE AVI METADATA ANALYSIS")
+    report_lines.append(f"📁 File: {file_path}")
+    report_lines.append(f"📊 File Size: {file_path.stat().st_size:,} bytes")
+    report_lines.append("=" * 80)
+
+    # 1. FILE SYSTEM TIMESTAMPS
+    report_lines.append("\n📅 1. FILE SYSTEM TIMESTAMPS:")
+    try:
+        stat = file_path.stat()
+        report_lines.append(
+            f"   📝 Creation Time:     {datetime.fromtimestamp(stat.st_ctime)}"
+        )
+        report_lines.append(
+            f"   ✏️  Modification Time: {datetime.fromtimestamp(stat.st_mtime)}"
+        )
+        report_lines.append(
+            f"   👁️  Access Time:      {datetime.fromtimestamp(stat.st_atime)}"
+        )
     except Exception as e:
-        print(f"   ❌ Error: {e}")
+        report_lines.append(f"   ❌ Error: {e}")
+
+    # The external tools run side by side; their output is reported below
+    (ffprobe_data, ffprobe_error), (exiftool_tags, exiftool_error) = asyncio.run(
+        _run_external_tools(file_path, exiftool_helper, cache_directory)
+    )
+
+    # 2. FFPROBE - ALL METADATA
+    # A single ffprobe run feeds both this section and the format tag summary below
+    report_lines.append("\n🎬 2. FFPROBE - ALL METADATA:")
+
+    if ffprobe_data is not None:
+        data = ffprobe_data
+
+        # Format metadata
+        if "format" in data and "tags" in data["format"]:
+            report_lines.append("   📦 FORMAT TAGS:")
+            for key, value in data["format"]["tags"].items():
+                if _DATE_KEY_PATTERN.search(key.lower()):
+                    report_lines.append(f"      🏷️  {key}: {value}")
+
+        # Stream metadata
+        if "streams" in data:
+            for i, stream in enumerate(data["streams"]):
+                if "tags" in stream:
+                    report_lines.append(
+                        f"   🎞️  STREAM {i} TAGS ({stream.get('codec_type', 'unknown')}):"
+                    )
+                    for key, value in stream["tags"].items():
+                        if _DATE_KEY_PATTERN.search(key.lower()):
+                            report_lines.append(f"      🏷️  {key}: {value}")
+    else:
+        report_lines.append(f"   ❌ {ffprobe_error}")
+
+    # 3. FFPROBE - FORMAT TAGS ONLY
+    report_lines.append("\n🏷️  3. FFPROBE - FORMAT TAGS (CSV):")
+    if ffprobe_data is not None:
+        format_tags = ffprobe_data.get("format", {}).get("tags", {})
+        report_lines.append(
+            f"   📋 Raw output: {','.join(str(v) for v in format_tags.values())}"
+        )
+    else:
+        report_lines.append("   ❌ No ffprobe data available")
 
     # 4. PYMEDIAINFO - COMPREHENSIVE
-    print("\n📊 4. PYMEDIAINFO - COMPREHENSIVE:")
+    report_lines.append("\n📊 4. PYMEDIAINFO - COMPREHENSIVE:")
     try:
         from pymediainfo import MediaInfo
 
         info = MediaInfo.parse(str(file_path))
 
         for track in info.tracks:
-            print(f"   🎭 TRACK TYPE: {track.track_type}")
+            report_lines.append(f"   🎭 TRACK TYPE: {track.track_type}")
             track_data = track.to_data()
 
             # Find all date/time related fields
             date_fields = {}
             for key, value in track_data.items():
-                if value and any(
-                    date_word in key.lower()
-                    for date_word in [
-                        "date",
-                        "time",
-                        "create",
-                        "record",
-                        "origin",
-                        "master",
-                    ]
-                ):
+                if value and _MEDIAINFO_DATE_KEY_PATTERN.search(key.lower()):
                     date_fields[key] = value
 
             if date_fields:
                 for key, value in date_fields.items():
-                    print(f"      📅 {key}: {value}")
+                    report_lines.append(f"      📅 {key}: {value}")
             else:
-                print("      ❌ No date fields found")
+                report_lines.append("      ❌ No date fields found")
     except ImportError:
-        print("   ⚠️  PyMediaInfo not available")
+        report_lines.append("   ⚠️  PyMediaInfo not available")
     except Exception as e:
-        print(f"   ❌ Error: {e}")
+        report_lines.append(f"   ❌ Error: {e}")
 
     # 5. EXIFTOOL (if available)
-    print("\n🔍 5. EXIFTOOL:")
-    try:
-        cmd = ["exiftool", "-time:all", "-s", str(file_path)]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode == 0:
-            lines = result.stdout.strip().split("\n")
-            for line in lines:
-                if line.strip():
-                    print(f"   📅 {line}")
-        else:
-            print(f"   ❌ ExifTool not available or failed")
-    except FileNotFoundError:
-        print("   ⚠️  ExifTool not installed")
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
+    report_lines.append("\n🔍 5. EXIFTOOL:")
+    if exiftool_tags is not None:
+        report_lines.extend(_exiftool_report_lines(exiftool_tags, file_path))
+    else:
+        report_lines.append(f"   {exiftool_error}")
 
     # 6. WINDOWS PROPERTY SYSTEM (if on Windows)
-    print("\n🪟 6. WINDOWS PROPERTY SYSTEM:")
+    report_lines.append("\n🪟 6. WINDOWS PROPERTY SYSTEM:")
     if sys.platform == "win32":
         try:
             import win32api
@@ -167,7 +498,7 @@ def analyze_avi_metadata(file_path):
 
             # Get extended file attributes
             attrs = win32api.GetFileAttributes(str(file_path))
-            print(f"   🗂️  File Attributes: {attrs}")
+            report_lines.append(f"   🗂️  File Attributes: {attrs}")
 
             # Try to get creation time via Windows API
             handle = win32file.CreateFile(
@@ -182,76 +513,135 @@ def analyze_avi_metadata(file_path):
             creation_time, access_time, write_time = win32file.GetFileTime(handle)
             win32file.CloseHandle(handle)
 
-            print(f"   📅 Windows Creation Time: {creation_time}")
-            print(f"   📅 Windows Access Time: {access_time}")
-            print(f"   📅 Windows Write Time: {write_time}")
+            report_lines.append(f"   📅 Windows Creation Time: {creation_time}")
+            report_lines.append(f"   📅 Windows Access Time: {access_time}")
+            report_lines.append(f"   📅 Windows Write Time: {write_time}")
 
         except ImportError:
-            print("   ⚠️  Windows API modules not available")
+            report_lines.append("   ⚠️  Windows API modules not available")
         except Exception as e:
-            print(f"   ❌ Error: {e}")
+            report_lines.append(f"   ❌ Error: {e}")
     else:
-        print("   ⚠️  Not on Windows")
+        report_lines.append("   ⚠️  Not on Windows")
 
     # 7. RAW HEX INSPECTION
-    print("\n🔬 7. RAW METADATA INSPECTION:")
+    report_lines.append("\n🔬 7. RAW METADATA INSPECTION:")
     try:
+        found_metadata = []
         with open(file_path, "rb") as f:
-            # Read first 64KB to look for metadata chunks
-            data = f.read(65536)
-
-            # Look for common AVI metadata signatures
-            signatures = [
-                b"IDIT",  # Digitization time
-                b"ICRD",  # Creation date
-                b"ISFT",  # Software
-                b"LIST",  # List chunk
-                b"INFO",  # Info chunk
-                b"date",  # Generic date
-                b"creation_time",  # Creation time
-            ]
-
-            found_metadata = []
-            for sig in signatures:
-                pos = data.find(sig)
-                if pos != -1:
-                    # Extract some context around the signature
-                    start = max(0, pos - 20)
-                    end = min(len(data), pos + 50)
-                    context = data[start:end]
-                    # Convert to readable format
-                    readable = "".join(
-                        chr(b) if 32 <= b <= 126 else f"\\x{b:02x}" for b in context
-                    )
-                    found_metadata.append(
-                        f"   🔍 Found {sig.decode('ascii', errors='ignore')} at offset {pos}: {readable}"
-                    )
+            # mmap cannot map an empty file, which has no RIFF header anyway
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    # One walk over the RIFF chunk headers finds every metadata chunk
+                    for chunk_id, offset, chunk_size in walk_riff_chunks(data):
+                        if chunk_id not in _REPORTED_CHUNK_IDS:
+                            continue
 
-            if found_metadata:
-                for item in found_metadata:
-                    print(item)
-            else:
-                print("   ❌ No metadata signatures found in first 64KB")
+                        name = chunk_id.decode("ascii", errors="ignore")
+                        payload_start = offset + 8
+                        if chunk_id == b"LIST":
+                            list_type = data[payload_start : payload_start + 4]
+                            found_metadata.append(
+                                f"   📂 LIST '{list_type.decode('ascii', errors='ignore')}' "
+                                f"at offset {offset} (size {chunk_size})"
+                            )
+                            continue
+
+                        payload = data[
+                            payload_start : payload_start + min(chunk_size, 64)
+                        ]
+                        # Convert to readable format (non-printable bytes become ".")
+                        readable = payload.translate(_PRINTABLE_BYTES).decode("ascii")
+                        found_metadata.append(
+                            f"   🔍 Found {name} at offset {offset} (size {chunk_size}): {readable}"
+                        )
+
+        if found_metadata:
+            report_lines.extend(found_metadata)
+        else:
+            report_lines.append("   ❌ No metadata chunks found in the RIFF header")
 
     except Exception as e:
-        print(f"   ❌ Error: {e}")
+        report_lines.append(f"   ❌ Error: {e}")
 
-    print("\n" + "=" * 80)
-    print("🎯 ANALYSIS COMPLETE!")
-    print(
+    report_lines.append("\n" + "=" * 80)
+    report_lines.append("🎯 ANALYSIS COMPLETE!")
+    report_lines.append(
         "📋 Look for date fields that might correspond to Windows File Explorer 'Media created'"
     )
-    print("=" * 80)
+    report_lines.append("=" * 80)
 
+    return "\n".join(report_lines) + "\n"
 
-if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python avi_metadata_analyzer.py <avi_file>")
-        sys.exit(1)
 
-    avi_file = sys.argv[1]
-    if not os.path.exists(avi_file):
-        print(f"Error: File not found: {avi_file}")
+def _collect_avi_files(patterns: List[str]) -> List[Path]:
+    """Expand files, directories and glob patterns into a list of AVI files."""
+    avi_files = []
+    for pattern in patterns:
+        for match in sorted(glob.glob(pattern)) or [pattern]:
+            path = Path(match)
+            if path.is_dir():
+                avi_files.extend(
+                    sorted(
+                        candidate
+                        for candidate in path.rglob("*")
+                        if candidate.is_file() and candidate.suffix.lower() == ".avi"
+                    )
+                )
+            elif path.is_file():
+                avi_files.append(path)
+            else:
+                print(f"Error: File not found: {match}")
+                sys.exit(1)
+    return avi_files
+
+
+def main():
+    """Main entry point for the script."""
+    parser = argparse.ArgumentParser(
+        description="Show all date fields of AVI files from every metadata source"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        help="AVI files, directories or glob patterns (e.g. 'videos/*.avi')",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="DIRECTORY",
+        help="Analyze every AVI file in a directory (recursively)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of files to analyze in parallel (default: CPU count + 4)",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always re-run ffprobe/ExifTool instead of using {DEFAULT_CACHE_DIRECTORY}",
+    )
+
+    parsed_arguments = parser.parse_args()
+
+    patterns = list(parsed_arguments.paths)
+    if parsed_arguments.batch:
+        if not Path(parsed_arguments.batch).is_dir():
+            print(f"Error: Directory not found: {parsed_arguments.batch}")
+            sys.exit(1)
+        patterns.append(parsed_arguments.batch)
+
+    if not patterns:
+        parser.print_usage()
         sys.exit(1)
 
-    analyze_avi_metadata(avi_file)
+    analyze_avi_files(
+        _collect_avi_files(patterns),
+        parsed_arguments.workers,
+        None if parsed_arguments.no_cache else DEFAULT_CACHE_DIRECTORY,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,71 @@ AVI RIFF Utilities
 Shared functions for AVI RIFF metadata manipulation across different tools.
 """
 
+import functools
 import struct
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
+
+# Precompiled RIFF field layouts (all RIFF integers are little-endian)
+_U32LE = struct.Struct("<L")
+_FOURCC = struct.Struct("<4s")
+_CHUNK_HEADER = struct.Struct("<4sL")
+
+# Canon date names (fixed English, independent of the current locale)
+_WEEKDAY_NAMES = ("MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN")
+_MONTH_NAMES = (
+    "JAN",
+    "FEB",
+    "MAR",
+    "APR",
+    "MAY",
+    "JUN",
+    "JUL",
+    "AUG",
+    "SEP",
+    "OCT",
+    "NOV",
+    "DEC",
+)
+_MONTH_NUMBERS = {name: number for number, name in enumerate(_MONTH_NAMES, start=1)}
+
+
+def walk_riff_chunks(data) -> Iterator[Tuple[bytes, int, int]]:
+    """
+    Walk the chunk headers of AVI RIFF data in file order.
+
+    LIST chunks are yielded and then descended into, except the 'movi' list
+    which holds the audio/video frames, so only the header part of the file
+    is touched.
+
+    Args:
+        data: AVI file data (bytes, bytearray, memoryview or mmap)
+
+    Yields:
+        Tuples of (chunk_id, chunk_position, chunk_size)
+    """
+    if len(data) < 12 or data[:4] != b"RIFF":
+        return
+
+    riff_size = _U32LE.unpack_from(data, 4)[0]
+    yield from _walk_chunk_list(data, 12, min(8 + riff_size, len(data)))
+
+
+def _walk_chunk_list(data, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+    """Yield the chunk headers between start and end, recursing into LISTs."""
+    offset = start
+    while offset + 8 <= end:
+        chunk_id, chunk_size = _CHUNK_HEADER.unpack_from(data, offset)
+        yield chunk_id, offset, chunk_size
+
+        if chunk_id == b"LIST" and offset + 12 <= end:
+            list_type = _FOURCC.unpack_from(data, offset + 8)[0]
+            if list_type != b"movi":
+                list_end = min(offset + 8 + chunk_size, end)
+                yield from _walk_chunk_list(data, offset + 12, list_end)
+
+        # Chunks are padded to an even size
+        offset += 8 + chunk_size + (chunk_size & 1)
 
 
 def find_idit_chunk(data: bytearray) -> Tuple[Optional[int], Optional[bytes]]:
@@ -14,39 +76,53 @@ def find_idit_chunk(data: bytearray) -> Tuple[Optional[int], Optional[bytes]]:
     Find IDIT chunk in AVI RIFF data.
 
     Args:
-        data: AVI file data as bytearray
+        data: AVI file data (bytes, bytearray, memoryview or mmap)
 
     Returns:
         Tuple of (chunk_position, date_data) or (None, None) if not found
     """
-    # Look for IDIT signature
-    pos = data.find(b"IDIT")
-    if pos == -1:
-        return None, None
+    for pos, chunk_size in _iter_idit_chunk_headers(data):
+        return (pos, _read_chunk_data(data, pos, chunk_size))
+    return None, None
+
+
+def find_idit_chunks(data) -> List[Tuple[int, bytes]]:
+    """
+    Find every IDIT chunk in AVI RIFF data in a single walk.
 
-    # IDIT chunk structure: IDIT + 4-byte size + data
-    if pos + 4 >= len(data):
-        return None, None
+    Some cameras write more than one date chunk; all of them need the same
+    change to keep the file consistent.
 
-    # Read the chunk size (little-endian)
-    size_bytes = data[pos + 4 : pos + 8]
-    if len(size_bytes) != 4:
-        return None, None
+    Args:
+        data: AVI file data (bytes, bytearray, memoryview or mmap)
 
-    chunk_size = struct.unpack("<L", size_bytes)[0]
+    Returns:
+        List of (chunk_position, date_data) tuples in file order
+    """
+    return [
+        (pos, _read_chunk_data(data, pos, chunk_size))
+        for pos, chunk_size in _iter_idit_chunk_headers(data)
+    ]
 
-    # Get the actual date data
-    date_start = pos + 8
-    date_end = date_start + chunk_size
 
-    if date_end > len(data):
-        return None, None
+def _iter_idit_chunk_headers(data) -> Iterator[Tuple[int, int]]:
+    """Yield (chunk_position, chunk_size) of the complete IDIT chunks."""
+    # Walk the RIFF header tree instead of scanning the whole file
+    for chunk_id, pos, chunk_size in walk_riff_chunks(data):
+        # IDIT chunk structure: IDIT + 4-byte size + data
+        if chunk_id == b"IDIT" and pos + 8 + chunk_size <= len(data):
+            yield pos, chunk_size
 
-    date_data = data[date_start:date_end]
 
-    return (pos, date_data)
+def _read_chunk_data(data, pos: int, chunk_size: int) -> bytes:
+    """Copy out the payload of the chunk at pos."""
+    # bytes (unlike a memoryview slice) do not keep an mmap'ed file pinned
+    # open after the caller is done with it
+    with memoryview(data) as view:
+        return view[pos + 8 : pos + 8 + chunk_size].tobytes()
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_canon_date(date_str: str) -> Optional[datetime]:
     """
     Parse Canon date format: 'MON AUG 28 14:14:28 2006'
@@ -61,13 +137,25 @@ def parse_canon_date(date_str: str) -> Optional[datetime]:
         # Remove null bytes and extra whitespace
         clean_date = date_str.strip().rstrip("\x00").strip()
 
-        # Parse the date format used by Canon
-        dt = datetime.strptime(clean_date, "%a %b %d %H:%M:%S %Y")
-        return dt
-    except ValueError:
+        # Split the fixed Canon layout directly instead of going through strptime
+        weekday, month, day, clock, year = clean_date.upper().split()
+        hour, minute, second = clock.split(":")
+        if weekday not in _WEEKDAY_NAMES:
+            return None
+
+        return datetime(
+            int(year),
+            _MONTH_NUMBERS[month],
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+        )
+    except (ValueError, KeyError):
         return None
 
 
+@functools.lru_cache(maxsize=4096)
 def format_canon_date(dt: datetime) -> str:
     """
     Format date in Canon format: 'MON AUG 28 14:14:28 2006'
@@ -78,4 +166,7 @@ def format_canon_date(dt: datetime) -> str:
     Returns:
         Formatted date string in Canon format
     """
-    return dt.strftime("%a %b %d %H:%M:%S %Y").upper()
+    return (
+        f"{_WEEKDAY_NAMES[dt.weekday()]} {_MONTH_NAMES[dt.month - 1]} {dt.day:02d} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d} {dt.year}"
+    )
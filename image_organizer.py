@@ -7,13 +7,18 @@ and handling duplicates and naming conflicts.
 """
 
 import argparse
+import functools
 import hashlib
+import mmap
 import os
 import shutil
+import struct
 import sys
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 try:
     from PIL import Image
@@ -32,6 +37,120 @@ try:
 except ImportError:
     MediaInfo = None
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import exiftool
+except ImportError:
+    exiftool = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Hashers used for duplicate detection, all producing 256-bit digests so the
+# hex digest length does not depend on the chosen algorithm
+_FILE_HASHER_FACTORIES = {
+    "blake2b": lambda: hashlib.blake2b(digest_size=32),
+    "sha256": hashlib.sha256,
+}
+if blake3:
+    _FILE_HASHER_FACTORIES["blake3"] = lambda max_threads=1: blake3.blake3(
+        max_threads=max_threads
+    )
+
+# Images passed to the persistent ExifTool process per request, and the
+# date tags read from them in priority order
+_EXIFTOOL_BATCH_SIZE = 500
+_EXIFTOOL_DATE_TAGS = ("EXIF:DateTimeOriginal", "EXIF:CreateDate", "EXIF:ModifyDate")
+
+# EXIF (TIFF) tags holding dates, in priority order, and the pointer from
+# IFD0 to the EXIF sub-IFD
+_EXIF_IFD_POINTER_TAG = 0x8769
+_EXIF_SUB_IFD_DATE_TAGS = (0x9003, 0x9004)  # DateTimeOriginal, DateTimeDigitized
+_IFD0_DATE_TAGS = (0x0132,)  # DateTime
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_JPEG_SEGMENT_HEADER = struct.Struct(">2sH")
+_PNG_CHUNK_HEADER = struct.Struct(">L4s")
+
+_IS_WINDOWS = os.name == "nt"
+
+# ISO base media (MP4/QuickTime) atoms; mvhd times count seconds from 1904
+_MP4_CONTAINER_EXTENSIONS = {".mp4", ".mov", ".m4v"}
+_MP4_ATOM_HEADER = struct.Struct(">L4s")
+_MP4_EPOCH = datetime(1904, 1, 1)
+
+# ioctl request creating a copy-on-write clone of a whole file (Linux btrfs/xfs)
+_FICLONE = 0x40049409
+_CAN_CLONE_FILES = fcntl is not None and sys.platform.startswith("linux")
+
+# Window size for the sampled fingerprint taken at the start, middle and end
+_SAMPLE_WINDOW_SIZE = 64 * 1024
+
+# Outcomes of _process_single_file
+_RESULT_DUPLICATE = 0
+_RESULT_PROCESSED = 1
+_RESULT_CONFLICT_RESOLVED = 2  # Processed under a new name
+
+# Organizer owned by the current pool worker process (see _init_organize_worker)
+_worker_organizer = None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_fixed_width_datetime(
+    date_string: str, date_separator: str
+) -> Optional[datetime]:
+    """
+    Parse 'YYYY<sep>MM<sep>DD HH:MM:SS' by slicing instead of strptime.
+
+    Cached because photos from a burst often share the same timestamp.
+    """
+    if (
+        len(date_string) != 19
+        or date_string[4] != date_separator
+        or date_string[7] != date_separator
+        or date_string[10] != " "
+        or date_string[13] != ":"
+        or date_string[16] != ":"
+    ):
+        return None
+
+    try:
+        return datetime(
+            int(date_string[0:4]),
+            int(date_string[5:7]),
+            int(date_string[8:10]),
+            int(date_string[11:13]),
+            int(date_string[14:16]),
+            int(date_string[17:19]),
+        )
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _date_folder_name(year: int, month: int, day: int) -> str:
+    """
+    Build the YYYY_MM_DD folder name for a day.
+
+    Cached because a library has far fewer distinct days than files.
+    """
+    return f"{year:04d}_{month:02d}_{day:02d}"
+
+
+@dataclass
+class MediaIndex:
+    """Discovered media files as parallel per-file lists filled in one scan."""
+
+    paths: List[Path] = field(default_factory=list)
+    sizes: List[int] = field(default_factory=list)
+    statistics: List[os.stat_result] = field(default_factory=list)
+    is_image: List[bool] = field(default_factory=list)
+
 
 class ImageVideoOrganizer:
     """Main class for organizing images and videos by creation date."""
@@ -49,18 +168,48 @@ class ImageVideoOrganizer:
     }
     VIDEO_EXTENSIONS = {".mp4", ".mov", ".avi", ".mkv", ".wmv", ".flv", ".webm", ".m4v"}
 
-    def __init__(self, source_path: str, destination_path: str = None):
+    # Suffix tuples for str.endswith, which matches all of them in one C call
+    _IMAGE_SUFFIXES = tuple(IMAGE_EXTENSIONS)
+    _MEDIA_SUFFIXES = tuple(IMAGE_EXTENSIONS | VIDEO_EXTENSIONS)
+
+    HASH_ALGORITHMS = ("blake3", "blake2b", "sha256")
+    COPY_MODES = ("copy", "hardlink")
+
+    def __init__(
+        self,
+        source_path: str,
+        destination_path: str = None,
+        hash_algorithm: str = "blake3",
+        max_workers: Optional[int] = None,
+        copy_mode: str = "copy",
+    ):
         """
         Initialize the organizer.
 
         Args:
             source_path: Path to scan for images/videos
             destination_path: Path to organize files to (defaults to source_path/organized)
+            hash_algorithm: Duplicate detection hash (blake3 falls back to blake2b
+                when the blake3 package is not installed)
+            max_workers: Processes used to read dates and hashes (defaults to CPU count)
+            copy_mode: "copy" to copy files, or "hardlink" to link them into the
+                destination when it is on the same file system
         """
         self.source_path = Path(source_path)
         if not self.source_path.exists():
             raise ValueError(f"Source path does not exist: {source_path}")
 
+        if hash_algorithm not in self.HASH_ALGORITHMS:
+            raise ValueError(f"Unsupported hash algorithm: {hash_algorithm}")
+        if hash_algorithm not in _FILE_HASHER_FACTORIES:
+            hash_algorithm = "blake2b"
+        self.hash_algorithm = hash_algorithm
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        if copy_mode not in self.COPY_MODES:
+            raise ValueError(f"Unsupported copy mode: {copy_mode}")
+        self.copy_mode = copy_mode
+
         self.destination_path = (
             Path(destination_path)
             if destination_path
@@ -68,6 +217,11 @@ class ImageVideoOrganizer:
         )
         self.destination_path.mkdir(parents=True, exist_ok=True)
 
+        self._file_hash_cache: Dict[Tuple[int, int, int, int], str] = {}
+        self._exif_date_cache: Dict[Path, Optional[datetime]] = {}
+        self._directory_names_cache: Dict[Path, Tuple[Set[str], Set[str]]] = {}
+        self._date_directories: Dict[str, Path] = {}
+
     def find_media_files(self) -> List[Path]:
         """
         Recursively find all supported image and video files.
@@ -75,50 +229,139 @@ class ImageVideoOrganizer:
         Returns:
             List of Path objects for found media files
         """
-        discovered_media_files = []
-        all_supported_extensions = self.IMAGE_EXTENSIONS | self.VIDEO_EXTENSIONS
+        return self._index_media_files().paths
 
-        for current_file_path in self.source_path.rglob("*"):
-            if self._is_supported_media_file(
-                current_file_path, all_supported_extensions
-            ):
-                discovered_media_files.append(current_file_path)
+    def _index_media_files(self) -> MediaIndex:
+        """
+        Scan the source tree once, collecting everything later stages need.
 
-        return discovered_media_files
+        Sizes and stat results come from the directory entry's cached stat
+        and the image/video split from the name already at hand, so the
+        organize loop does not stat or re-parse paths again.
+        """
+        media_index = MediaIndex()
+        source_directory = str(self.source_path)
 
-    def _is_supported_media_file(
-        self, file_path: Path, supported_extensions: Set[str]
-    ) -> bool:
-        """Check if a file is a supported media file."""
-        return file_path.is_file() and file_path.suffix.lower() in supported_extensions
+        for directory_entry, is_image in self._scandir_recursive(
+            source_directory, self._destination_scan_path(source_directory)
+        ):
+            entry_statistics = directory_entry.stat(follow_symlinks=False)
+            media_index.paths.append(Path(directory_entry.path))
+            media_index.sizes.append(entry_statistics.st_size)
+            media_index.statistics.append(entry_statistics)
+            media_index.is_image.append(is_image)
+
+        return media_index
+
+    def _destination_scan_path(self, source_directory: str) -> Optional[str]:
+        """
+        Spell the destination the way the source scan will reach it.
+
+        The scan does not follow directory symlinks, so entry paths are the
+        source path joined with real names. Resolving both paths once and
+        re-rooting the destination under the source path lets the scan skip
+        it with a plain string comparison per directory.
+
+        Returns:
+            Normalized destination path as seen by the scan, or None if the
+            destination is not inside the source tree
+        """
+        real_source = os.path.realpath(source_directory)
+        real_destination = os.path.realpath(self.destination_path)
+        if os.path.normcase(real_destination) == os.path.normcase(real_source):
+            return None
+
+        try:
+            relative_destination = os.path.relpath(real_destination, real_source)
+        except ValueError:  # Different drives on Windows
+            return None
+        if relative_destination.startswith(os.pardir):
+            return None
+
+        return os.path.normcase(os.path.join(source_directory, relative_destination))
 
-    def get_creation_date(self, file_path: Path) -> datetime:
+    def _scandir_recursive(
+        self, directory_path: str, skipped_directory: Optional[str] = None
+    ) -> Iterator[Tuple[os.DirEntry, bool]]:
+        """
+        Yield (entry, is_image) for the supported media files below a directory.
+
+        Uses os.scandir so file type checks come from the cached directory
+        entry instead of a stat() call per file. The skipped directory (the
+        destination) is not descended into, so already organized files are
+        never revisited.
+        """
+        try:
+            with os.scandir(directory_path) as directory_entries:
+                for directory_entry in directory_entries:
+                    if directory_entry.is_dir(follow_symlinks=False):
+                        if os.path.normcase(directory_entry.path) != skipped_directory:
+                            yield from self._scandir_recursive(
+                                directory_entry.path, skipped_directory
+                            )
+                        continue
+
+                    # Lowercase the name once for both the media and image checks
+                    lowercase_name = directory_entry.name.lower()
+                    if lowercase_name.endswith(
+                        self._MEDIA_SUFFIXES
+                    ) and directory_entry.is_file(follow_symlinks=False):
+                        yield directory_entry, lowercase_name.endswith(
+                            self._IMAGE_SUFFIXES
+                        )
+        except PermissionError:
+            pass
+
+    def get_creation_date(
+        self, file_path: Path, is_image: Optional[bool] = None
+    ) -> datetime:
         """
         Extract creation date from file metadata.
 
         Args:
             file_path: Path to the media file
+            is_image: Whether the file is an image or a video, if already known
+                from the media index (otherwise derived from the extension)
 
         Returns:
             datetime object representing the creation date
         """
+        # Derive the suffix once and hand it to the helpers that need it
+        file_extension = file_path.suffix.lower()
+        if is_image is None:
+            if file_extension in self.IMAGE_EXTENSIONS:
+                is_image = True
+            elif file_extension in self.VIDEO_EXTENSIONS:
+                is_image = False
+
         # Try EXIF data for images
-        if file_path.suffix.lower() in self.IMAGE_EXTENSIONS:
-            date = self._get_image_creation_date(file_path)
+        if is_image:
+            date = self._get_image_creation_date(file_path, file_extension)
             if date:
                 return date
 
         # Try video metadata
-        elif file_path.suffix.lower() in self.VIDEO_EXTENSIONS:
-            date = self._get_video_creation_date(file_path)
+        elif is_image is False:
+            date = self._get_video_creation_date(file_path, file_extension)
             if date:
                 return date
 
         # Fallback to file system dates
         return self._get_file_system_date(file_path)
 
-    def _get_image_creation_date(self, file_path: Path) -> Optional[datetime]:
+    def _get_image_creation_date(
+        self, file_path: Path, file_extension: Optional[str] = None
+    ) -> Optional[datetime]:
         """Extract creation date from image EXIF data."""
+        # Images already read by the batched ExifTool pass need no parsing
+        if file_path in self._exif_date_cache:
+            return self._exif_date_cache[file_path]
+
+        # Read the EXIF block of JPEG/PNG directly instead of decoding headers
+        creation_date = self._extract_date_from_exif_block(file_path, file_extension)
+        if creation_date:
+            return creation_date
+
         creation_date = self._extract_date_with_pillow(file_path)
         if creation_date:
             return creation_date
@@ -129,6 +372,201 @@ class ImageVideoOrganizer:
 
         return None
 
+    def _prefetch_image_dates(self, media_files: List[Path]):
+        """
+        Read the EXIF dates of all images through one persistent ExifTool process.
+
+        Starting ExifTool once (``-stay_open``) and feeding it batches of
+        files is much cheaper than opening every image with Pillow and
+        exifread. If ExifTool fails on a batch, the whole batch is left out of
+        the cache and every image in it goes through the regular per-file
+        extraction. Images that ExifTool returns without a date tag are cached
+        as having no date. Images missing from its output are not cached.
+
+        Args:
+            media_files: Discovered media files (non-images are ignored)
+        """
+        if not exiftool:
+            return
+
+        image_paths_by_name = {
+            os.path.normpath(media_file_path): media_file_path
+            for media_file_path in media_files
+            if media_file_path.suffix.lower() in self.IMAGE_EXTENSIONS
+        }
+        image_file_names = list(image_paths_by_name)
+        if not image_file_names:
+            return
+
+        try:
+            with exiftool.ExifToolHelper() as exiftool_helper:
+                for batch_start in range(
+                    0, len(image_file_names), _EXIFTOOL_BATCH_SIZE
+                ):
+                    try:
+                        metadata_entries = exiftool_helper.get_tags(
+                            image_file_names[
+                                batch_start : batch_start + _EXIFTOOL_BATCH_SIZE
+                            ],
+                            tags=list(_EXIFTOOL_DATE_TAGS),
+                        )
+                    except Exception:
+                        continue
+
+                    for metadata_entry in metadata_entries:
+                        image_path = image_paths_by_name.get(
+                            os.path.normpath(metadata_entry.get("SourceFile", ""))
+                        )
+                        if image_path is not None:
+                            self._exif_date_cache[image_path] = (
+                                self._exiftool_entry_date(metadata_entry)
+                            )
+        except Exception:
+            # ExifTool executable not available
+            pass
+
+    def _exiftool_entry_date(self, metadata_entry: dict) -> Optional[datetime]:
+        """Pick the highest priority parseable date from an ExifTool result."""
+        for tag_name in _EXIFTOOL_DATE_TAGS:
+            date_value = metadata_entry.get(tag_name)
+            if date_value:
+                parsed_date = self._parse_exif_datetime(str(date_value))
+                if parsed_date:
+                    return parsed_date
+        return None
+
+    def _extract_date_from_exif_block(
+        self, file_path: Path, file_extension: Optional[str] = None
+    ) -> Optional[datetime]:
+        """Extract creation date from the raw EXIF block of a JPEG or PNG file."""
+        if file_extension is None:
+            file_extension = file_path.suffix.lower()
+
+        try:
+            with open(file_path, "rb") as file_handle:
+                if file_extension in (".jpg", ".jpeg"):
+                    tiff_data = self._read_jpeg_exif_block(file_handle)
+                elif file_extension == ".png":
+                    tiff_data = self._read_png_exif_block(file_handle)
+                else:
+                    return None
+
+            if tiff_data:
+                return self._parse_tiff_exif_date(tiff_data)
+        except (OSError, struct.error):
+            pass
+
+        return None
+
+    def _read_jpeg_exif_block(self, file_handle) -> Optional[bytes]:
+        """Return the TIFF data of a JPEG's APP1 Exif segment, if any."""
+        if file_handle.read(2) != b"\xff\xd8":
+            return None
+
+        # Walk the segment headers up to the start of the image data
+        while True:
+            segment_header = file_handle.read(_JPEG_SEGMENT_HEADER.size)
+            if len(segment_header) < _JPEG_SEGMENT_HEADER.size:
+                return None
+
+            marker, segment_length = _JPEG_SEGMENT_HEADER.unpack(segment_header)
+            # The length counts its own two bytes, so less than 2 is corrupt
+            if marker[0] != 0xFF or marker == b"\xff\xda" or segment_length < 2:
+                return None
+
+            # Only APP1 segments can hold Exif; skip the others unread
+            if marker != b"\xff\xe1":
+                file_handle.seek(segment_length - 2, os.SEEK_CUR)
+                continue
+
+            segment_data = file_handle.read(segment_length - 2)
+            if segment_data.startswith(b"Exif\x00\x00"):
+                return segment_data[6:]
+
+    def _read_png_exif_block(self, file_handle) -> Optional[bytes]:
+        """Return the TIFF data of a PNG's eXIf chunk, if any."""
+        if file_handle.read(len(_PNG_SIGNATURE)) != _PNG_SIGNATURE:
+            return None
+
+        # eXIf must come before the image data, so stop at IDAT
+        while True:
+            chunk_header = file_handle.read(_PNG_CHUNK_HEADER.size)
+            if len(chunk_header) < _PNG_CHUNK_HEADER.size:
+                return None
+
+            chunk_length, chunk_type = _PNG_CHUNK_HEADER.unpack(chunk_header)
+            if chunk_type == b"eXIf":
+                return file_handle.read(chunk_length)
+            if chunk_type in (b"IDAT", b"IEND"):
+                return None
+
+            file_handle.seek(chunk_length + 4, os.SEEK_CUR)  # data + CRC
+
+    def _parse_tiff_exif_date(self, tiff_data: bytes) -> Optional[datetime]:
+        """Parse the date tags out of EXIF TIFF data (IFD0 and EXIF sub-IFD)."""
+        if tiff_data[:2] == b"II":
+            byte_order = "<"
+        elif tiff_data[:2] == b"MM":
+            byte_order = ">"
+        else:
+            return None
+
+        first_ifd_offset = struct.unpack_from(byte_order + "L", tiff_data, 4)[0]
+        ifd0_entries = self._read_tiff_ifd(tiff_data, byte_order, first_ifd_offset)
+
+        tag_values = {}
+        exif_ifd_entry = ifd0_entries.get(_EXIF_IFD_POINTER_TAG)
+        if exif_ifd_entry:
+            exif_ifd_offset = struct.unpack(byte_order + "L", exif_ifd_entry[2])[0]
+            tag_values.update(
+                self._read_tiff_ifd(tiff_data, byte_order, exif_ifd_offset)
+            )
+        tag_values.update(
+            (tag, entry)
+            for tag, entry in ifd0_entries.items()
+            if tag in _IFD0_DATE_TAGS
+        )
+
+        for tag in _EXIF_SUB_IFD_DATE_TAGS + _IFD0_DATE_TAGS:
+            tag_entry = tag_values.get(tag)
+            if not tag_entry or tag_entry[0] != 2:  # dates are ASCII values
+                continue
+
+            value_type, value_count, value_field = tag_entry
+            if value_count <= 4:
+                date_bytes = value_field[:value_count]
+            else:
+                value_offset = struct.unpack(byte_order + "L", value_field)[0]
+                date_bytes = tiff_data[value_offset : value_offset + value_count]
+
+            parsed_date = self._parse_exif_datetime(
+                date_bytes.rstrip(b"\x00").decode("ascii", "replace")
+            )
+            if parsed_date:
+                return parsed_date
+
+        return None
+
+    def _read_tiff_ifd(
+        self, tiff_data: bytes, byte_order: str, ifd_offset: int
+    ) -> dict:
+        """Read a TIFF IFD into {tag: (type, count, raw 4-byte value field)}."""
+        entry_count = struct.unpack_from(byte_order + "H", tiff_data, ifd_offset)[0]
+        ifd_entries = {}
+
+        for entry_index in range(entry_count):
+            entry_offset = ifd_offset + 2 + entry_index * 12
+            tag, value_type, value_count = struct.unpack_from(
+                byte_order + "HHL", tiff_data, entry_offset
+            )
+            ifd_entries[tag] = (
+                value_type,
+                value_count,
+                tiff_data[entry_offset + 8 : entry_offset + 12],
+            )
+
+        return ifd_entries
+
     def _extract_date_with_pillow(self, file_path: Path) -> Optional[datetime]:
         """Extract creation date using PIL library."""
         if not Image or not TAGS:
@@ -182,13 +620,21 @@ class ImageVideoOrganizer:
 
     def _parse_exif_datetime(self, date_string: str) -> Optional[datetime]:
         """Parse EXIF datetime string to datetime object."""
-        try:
-            return datetime.strptime(date_string, "%Y:%m:%d %H:%M:%S")
-        except ValueError:
-            return None
+        return _parse_fixed_width_datetime(date_string, ":")
 
-    def _get_video_creation_date(self, file_path: Path) -> Optional[datetime]:
+    def _get_video_creation_date(
+        self, file_path: Path, file_extension: Optional[str] = None
+    ) -> Optional[datetime]:
         """Extract creation date from video metadata."""
+        if file_extension is None:
+            file_extension = file_path.suffix.lower()
+
+        # MP4/MOV keep the creation time in the movie header; read it directly
+        if file_extension in _MP4_CONTAINER_EXTENSIONS:
+            creation_date = self._read_mp4_creation_time(file_path)
+            if creation_date:
+                return creation_date
+
         if not MediaInfo:
             return None
 
@@ -203,6 +649,75 @@ class ImageVideoOrganizer:
 
         return None
 
+    def _read_mp4_creation_time(self, file_path: Path) -> Optional[datetime]:
+        """Read the creation time from the mvhd atom of an MP4/MOV file."""
+        try:
+            with open(file_path, "rb") as file_handle:
+                file_size = os.fstat(file_handle.fileno()).st_size
+                movie_atom = self._find_mp4_atom(file_handle, b"moov", 0, file_size)
+                if movie_atom is None:
+                    return None
+                movie_header_atom = self._find_mp4_atom(
+                    file_handle, b"mvhd", *movie_atom
+                )
+                if movie_header_atom is None:
+                    return None
+
+                file_handle.seek(movie_header_atom[0])
+                movie_header = file_handle.read(12)
+
+            # Version 1 headers use 64-bit times, version 0 headers 32-bit
+            if movie_header[0] == 1:
+                creation_seconds = struct.unpack_from(">Q", movie_header, 4)[0]
+            else:
+                creation_seconds = struct.unpack_from(">L", movie_header, 4)[0]
+        except (OSError, struct.error, IndexError):
+            return None
+
+        if not creation_seconds:  # Unset creation time
+            return None
+
+        try:
+            return _MP4_EPOCH + timedelta(seconds=creation_seconds)
+        except OverflowError:
+            return None
+
+    def _find_mp4_atom(
+        self, file_handle, atom_type: bytes, start: int, end: int
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Find the first atom of a type between two offsets by walking headers.
+
+        Large atoms such as mdat are seeked over rather than read, so the
+        movie header is found even when it sits at the end of the file.
+
+        Returns:
+            Tuple of (payload_start, payload_end) or None if not found
+        """
+        atom_offset = start
+        while atom_offset + _MP4_ATOM_HEADER.size <= end:
+            file_handle.seek(atom_offset)
+            atom_header = file_handle.read(_MP4_ATOM_HEADER.size)
+            if len(atom_header) < _MP4_ATOM_HEADER.size:
+                return None
+
+            atom_size, current_atom_type = _MP4_ATOM_HEADER.unpack(atom_header)
+            header_size = _MP4_ATOM_HEADER.size
+            if atom_size == 1:  # 64-bit size follows the type
+                atom_size = struct.unpack(">Q", file_handle.read(8))[0]
+                header_size += 8
+            elif atom_size == 0:  # Atom extends to the end
+                atom_size = end - atom_offset
+
+            if atom_size < header_size:
+                return None
+            if current_atom_type == atom_type:
+                return atom_offset + header_size, min(atom_offset + atom_size, end)
+
+            atom_offset += atom_size
+
+        return None
+
     def _find_general_track(self, media_information):
         """Find the general track containing metadata in video file."""
         for track in media_information.tracks:
@@ -229,7 +744,7 @@ class ImageVideoOrganizer:
             # Handle UTC timestamp format
             if "UTC" in date_string:
                 cleaned_date_string = date_string.replace(" UTC", "")
-                return datetime.strptime(cleaned_date_string, "%Y-%m-%d %H:%M:%S")
+                return _parse_fixed_width_datetime(cleaned_date_string, "-")
 
             # Handle ISO format
             iso_formatted_string = date_string.replace("T", " ").replace("Z", "")
@@ -240,29 +755,22 @@ class ImageVideoOrganizer:
     def _get_file_system_date(self, file_path: Path) -> datetime:
         """Get creation date from file system metadata."""
         file_statistics = file_path.stat()
-        available_timestamps = self._collect_available_timestamps(file_statistics)
-        earliest_timestamp = min(available_timestamps)
-
-        return datetime.fromtimestamp(earliest_timestamp)
-
-    def _collect_available_timestamps(self, file_statistics) -> List[float]:
-        """Collect all available timestamps from file statistics."""
-        timestamps = [file_statistics.st_mtime]  # Always include modification time
+        earliest_timestamp = file_statistics.st_mtime  # Always available
 
         if hasattr(file_statistics, "st_birthtime"):  # macOS
-            timestamps.append(file_statistics.st_birthtime)
-        elif os.name == "nt":  # Windows - st_ctime is creation time
-            timestamps.append(file_statistics.st_ctime)
+            earliest_timestamp = min(earliest_timestamp, file_statistics.st_birthtime)
+        elif _IS_WINDOWS:  # Windows - st_ctime is creation time
+            earliest_timestamp = min(earliest_timestamp, file_statistics.st_ctime)
 
-        return timestamps
+        return datetime.fromtimestamp(earliest_timestamp)
 
     def format_date_folder(self, date: datetime) -> str:
         """Format datetime to YYYY_MM_DD folder name."""
-        return date.strftime("%Y_%m_%d")
+        return _date_folder_name(date.year, date.month, date.day)
 
     def calculate_file_hash(self, file_path: Path) -> str:
         """
-        Calculate SHA-256 hash of a file for duplicate detection.
+        Calculate the content hash of a file for duplicate detection.
 
         Args:
             file_path: Path to the file
@@ -270,34 +778,164 @@ class ImageVideoOrganizer:
         Returns:
             Hexadecimal string representation of the file hash
         """
-        file_hasher = hashlib.sha256()
-        chunk_size = 4096
-
-        with open(file_path, "rb") as file_handle:
-            for data_chunk in iter(lambda: file_handle.read(chunk_size), b""):
-                file_hasher.update(data_chunk)
+        create_file_hasher = _FILE_HASHER_FACTORIES[self.hash_algorithm]
+
+        if self.hash_algorithm == "blake3":
+            # BLAKE3 maps the file itself. It only hashes on all cores when no
+            # worker processes hash alongside it; otherwise every worker would
+            # start a thread per core
+            file_hasher = create_file_hasher(
+                max_threads=blake3.blake3.AUTO if self.max_workers <= 1 else 1
+            )
+            file_hasher.update_mmap(file_path)
+            return file_hasher.hexdigest()
+
+        with open(file_path, "rb", buffering=0) as file_handle:
+            # Python 3.11+ hashes the whole file in a C read loop
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(file_handle, create_file_hasher).hexdigest()
+
+            file_hasher = create_file_hasher()
+            # mmap cannot map an empty file
+            if os.fstat(file_handle.fileno()).st_size > 0:
+                with mmap.mmap(
+                    file_handle.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mapped_file:
+                    file_hasher.update(mapped_file)
 
         return file_hasher.hexdigest()
 
-    def is_duplicate(self, file_path: Path, existing_hashes: Set[str]) -> bool:
+    def is_duplicate(
+        self,
+        file_path: Path,
+        existing_hashes: Set[str],
+        file_statistics: Optional[os.stat_result] = None,
+    ) -> bool:
         """
         Check if a file is a duplicate based on its hash.
 
         Args:
             file_path: Path to the file to check
             existing_hashes: Set of existing file hashes
+            file_statistics: Stat result already at hand (e.g. from the scan)
 
         Returns:
             True if the file is a duplicate, False otherwise
         """
-        file_hash = self.calculate_file_hash(file_path)
+        file_hash = self._cached_file_hash(file_path, file_statistics)
         return file_hash in existing_hashes
 
+    def _file_hash_key(
+        self, file_path: Path, file_statistics: Optional[os.stat_result] = None
+    ) -> Tuple[int, int, int, int]:
+        """
+        Identify a file version for the hash cache.
+
+        Device and inode identify the file however it is reached; size and
+        modification time invalidate the entry when the file changes. A stat
+        result already at hand is reused unless it lacks the inode, which is
+        the case for directory entries on Windows.
+        """
+        if file_statistics is None or not file_statistics.st_ino:
+            file_statistics = os.stat(file_path)
+        return (
+            file_statistics.st_dev,
+            file_statistics.st_ino,
+            file_statistics.st_size,
+            file_statistics.st_mtime_ns,
+        )
+
+    def _cached_file_hash(
+        self, file_path: Path, file_statistics: Optional[os.stat_result] = None
+    ) -> str:
+        """Return the file hash, reading each unchanged file at most once."""
+        file_hash_key = self._file_hash_key(file_path, file_statistics)
+        if file_hash_key not in self._file_hash_cache:
+            self._file_hash_cache[file_hash_key] = self.calculate_file_hash(file_path)
+        return self._file_hash_cache[file_hash_key]
+
+    def _remember_file_hash(
+        self,
+        file_path: Path,
+        file_hash: str,
+        file_statistics: Optional[os.stat_result] = None,
+    ):
+        """Record a hash that is already known (e.g. computed by a worker)."""
+        file_hash_key = self._file_hash_key(file_path, file_statistics)
+        self._file_hash_cache[file_hash_key] = file_hash
+
+    def _calculate_sample_fingerprint(self, file_path: Path, file_size: int) -> str:
+        """Hash three windows (start, middle, end) of a file as a cheap pre-filter."""
+        sample_hasher = hashlib.blake2b(digest_size=16)
+        sample_offsets = (
+            0,
+            file_size // 2,
+            max(file_size - _SAMPLE_WINDOW_SIZE, 0),
+        )
+
+        with open(file_path, "rb") as file_handle:
+            for sample_offset in sample_offsets:
+                file_handle.seek(sample_offset)
+                sample_hasher.update(file_handle.read(_SAMPLE_WINDOW_SIZE))
+
+        return sample_hasher.hexdigest()
+
+    def _find_duplicate_candidates(
+        self, media_files: List[Path], file_sizes: Optional[List[int]] = None
+    ) -> Set[Path]:
+        """
+        Find the files that may have the same content as another media file.
+
+        Files are bucketed by size first and then by a sampled fingerprint;
+        only files still sharing a bucket need a full hash. A file that cannot
+        be read is kept as a candidate so the error surfaces when processed.
+
+        Args:
+            media_files: Discovered media files
+            file_sizes: Sizes of media_files from the media index (stat'ed if None)
+
+        Returns:
+            Set of paths that need a full hash for duplicate detection
+        """
+        if file_sizes is None:
+            file_sizes = [
+                media_file_path.stat().st_size for media_file_path in media_files
+            ]
+
+        files_by_size: Dict[int, List[Path]] = {}
+        for media_file_path, file_size in zip(media_files, file_sizes):
+            files_by_size.setdefault(file_size, []).append(media_file_path)
+
+        duplicate_candidates: Set[Path] = set()
+        for file_size, same_size_files in files_by_size.items():
+            if len(same_size_files) < 2:
+                continue
+
+            files_by_fingerprint: Dict[str, List[Path]] = {}
+            for media_file_path in same_size_files:
+                try:
+                    sample_fingerprint = self._calculate_sample_fingerprint(
+                        media_file_path, file_size
+                    )
+                except OSError:
+                    duplicate_candidates.add(media_file_path)
+                    continue
+                files_by_fingerprint.setdefault(sample_fingerprint, []).append(
+                    media_file_path
+                )
+
+            for same_fingerprint_files in files_by_fingerprint.values():
+                if len(same_fingerprint_files) > 1:
+                    duplicate_candidates.update(same_fingerprint_files)
+
+        return duplicate_candidates
+
     def generate_unique_filename(
         self,
         destination_directory: Path,
         original_filename: str,
         source_file_path: Path,
+        source_statistics: Optional[os.stat_result] = None,
     ) -> Optional[str]:
         """
         Generate a unique filename to avoid naming conflicts.
@@ -306,12 +944,12 @@ class ImageVideoOrganizer:
             destination_directory: Directory where the file will be placed
             original_filename: Original filename
             source_file_path: Path to the source file being copied
+            source_statistics: Stat result of the source file, if already known
 
         Returns:
             Unique filename that doesn't conflict with existing files, or None if file is duplicate
         """
-        filename_without_extension = Path(original_filename).stem
-        file_extension = Path(original_filename).suffix
+        filename_without_extension, file_extension = os.path.splitext(original_filename)
         iteration_counter = 1
 
         while True:
@@ -322,12 +960,14 @@ class ImageVideoOrganizer:
                 original_filename,
             )
 
-            candidate_file_path = destination_directory / candidate_filename
-
-            if not candidate_file_path.exists():
+            if not self._is_file_name_taken(destination_directory, candidate_filename):
                 return candidate_filename
 
-            if self._is_same_file_content(candidate_file_path, source_file_path):
+            candidate_file_path = destination_directory / candidate_filename
+
+            if self._is_same_file_content(
+                candidate_file_path, source_file_path, source_statistics
+            ):
                 return None  # Duplicate file, no need to copy
 
             iteration_counter += 1
@@ -336,6 +976,49 @@ class ImageVideoOrganizer:
                     f"Could not generate unique filename for {original_filename}"
                 )
 
+    def _is_file_name_taken(self, directory_path: Path, file_name: str) -> bool:
+        """
+        Check whether a name is already used in a destination directory.
+
+        Exact names are a set lookup. A name that only differs in case is a
+        conflict only on case-insensitive file systems, so such a hit is
+        confirmed with lexists(), which finds the other file only there.
+        """
+        exact_names, case_folded_names = self._directory_file_names(directory_path)
+        if file_name in exact_names:
+            return True
+        return file_name.casefold() in case_folded_names and os.path.lexists(
+            directory_path / file_name
+        )
+
+    def _directory_file_names(self, directory_path: Path) -> Tuple[Set[str], Set[str]]:
+        """
+        Return the exact and the case-folded names in a destination directory.
+
+        The directory is listed once and the sets are then kept up to date as
+        files are copied (see _remember_file_name), so conflict checks are set
+        lookups instead of a stat() per candidate name.
+        """
+        if directory_path not in self._directory_names_cache:
+            try:
+                with os.scandir(directory_path) as directory_entries:
+                    exact_names = {
+                        directory_entry.name for directory_entry in directory_entries
+                    }
+            except FileNotFoundError:
+                exact_names = set()
+            self._directory_names_cache[directory_path] = (
+                exact_names,
+                {file_name.casefold() for file_name in exact_names},
+            )
+        return self._directory_names_cache[directory_path]
+
+    def _remember_file_name(self, directory_path: Path, file_name: str):
+        """Record a name just placed in a destination directory."""
+        exact_names, case_folded_names = self._directory_file_names(directory_path)
+        exact_names.add(file_name)
+        case_folded_names.add(file_name.casefold())
+
     def _create_candidate_filename(
         self, base_name: str, extension: str, counter: int, original: str
     ) -> str:
@@ -346,12 +1029,15 @@ class ImageVideoOrganizer:
             return f"{base_name}_{counter:03d}{extension}"
 
     def _is_same_file_content(
-        self, existing_file_path: Path, new_file_path: Path
+        self,
+        existing_file_path: Path,
+        new_file_path: Path,
+        new_file_statistics: Optional[os.stat_result] = None,
     ) -> bool:
         """Check if two files have the same content by comparing their hashes."""
         try:
-            existing_file_hash = self.calculate_file_hash(existing_file_path)
-            new_file_hash = self.calculate_file_hash(new_file_path)
+            existing_file_hash = self._cached_file_hash(existing_file_path)
+            new_file_hash = self._cached_file_hash(new_file_path, new_file_statistics)
             return existing_file_hash == new_file_hash
         except (FileNotFoundError, PermissionError):
             # If we can't read files for comparison, assume they're different
@@ -364,34 +1050,117 @@ class ImageVideoOrganizer:
         Returns:
             Dictionary with organization statistics
         """
-        discovered_media_files = self.find_media_files()
+        media_index = self._index_media_files()
+        discovered_media_files = media_index.paths
         organization_statistics = self._initialize_statistics(discovered_media_files)
 
+        duplicate_candidates = self._find_duplicate_candidates(
+            discovered_media_files, media_index.sizes
+        )
+        self._prefetch_image_dates(discovered_media_files)
+        file_analyses = self._analyze_media_files(media_index, duplicate_candidates)
         processed_file_hashes: Set[str] = set()
         files_organized_by_date: Dict[str, List[Path]] = {}
 
-        for current_file_path in discovered_media_files:
+        # Count in locals and write the statistics once after the loop
+        processed_count = duplicates_count = conflicts_count = errors_count = 0
+
+        # Scan stat results stand in for a fresh stat() in the hash cache
+        for current_file_path, file_statistics, file_analysis in zip(
+            discovered_media_files, media_index.statistics, file_analyses
+        ):
+            creation_date, file_hash, analysis_error = file_analysis
             try:
-                if self._should_skip_file(current_file_path, processed_file_hashes):
-                    organization_statistics["duplicates_skipped"] += 1
+                if analysis_error:
+                    raise analysis_error
+                if file_hash:
+                    self._remember_file_hash(
+                        current_file_path, file_hash, file_statistics
+                    )
+
+                if self._should_skip_file(
+                    current_file_path,
+                    processed_file_hashes,
+                    duplicate_candidates,
+                    file_statistics,
+                ):
+                    duplicates_count += 1
                     continue
 
-                processed_file_result = self._process_single_file(
-                    current_file_path, processed_file_hashes, files_organized_by_date
+                file_result = self._process_single_file(
+                    current_file_path,
+                    processed_file_hashes,
+                    files_organized_by_date,
+                    duplicate_candidates,
+                    creation_date,
+                    file_statistics,
                 )
 
-                self._update_statistics_from_file_result(
-                    organization_statistics, processed_file_result
-                )
+                if file_result == _RESULT_DUPLICATE:
+                    duplicates_count += 1
+                else:
+                    processed_count += 1
+                    if file_result == _RESULT_CONFLICT_RESOLVED:
+                        conflicts_count += 1
 
             except Exception as error:
                 print(f"Error processing {current_file_path}: {error}")
-                organization_statistics["errors"] += 1
+                errors_count += 1
                 continue
 
+        organization_statistics["processed"] = processed_count
+        organization_statistics["duplicates_skipped"] = duplicates_count
+        organization_statistics["conflicts_resolved"] = conflicts_count
+        organization_statistics["errors"] = errors_count
         self._finalize_statistics(organization_statistics, files_organized_by_date)
         return organization_statistics
 
+    def _analyze_media_files(
+        self, media_index: MediaIndex, duplicate_candidates: Set[Path]
+    ) -> Iterator[Tuple[Optional[datetime], Optional[str], Optional[Exception]]]:
+        """
+        Read creation dates (and hashes of duplicate candidates) for all files.
+
+        Metadata parsing and hashing are independent per file, so they run in
+        worker processes; copying stays in the main process so conflict
+        resolution remains deterministic. Results are yielded as soon as they
+        are ready, so the caller copies files while workers keep reading the
+        files after them.
+
+        Yields:
+            (creation_date, file_hash, error) tuples in media index order
+        """
+        analysis_tasks = [
+            (media_file_path, is_image, media_file_path in duplicate_candidates)
+            for media_file_path, is_image in zip(
+                media_index.paths, media_index.is_image
+            )
+        ]
+
+        if len(analysis_tasks) <= 1 or self.max_workers <= 1:
+            for analysis_task in analysis_tasks:
+                yield self._analyze_media_file(*analysis_task)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(analysis_tasks)),
+            initializer=_init_organize_worker,
+            initargs=(self,),
+        ) as executor:
+            yield from executor.map(_analyze_file, analysis_tasks, chunksize=32)
+
+    def _analyze_media_file(
+        self, file_path: Path, is_image: bool, needs_hash: bool
+    ) -> Tuple[Optional[datetime], Optional[str], Optional[Exception]]:
+        """Read one file's creation date and, if requested, its content hash."""
+        try:
+            creation_date = self.get_creation_date(file_path, is_image)
+            file_hash = self.calculate_file_hash(file_path) if needs_hash else None
+            return creation_date, file_hash, None
+        except Exception as error:
+            # Reported by organize_files together with the file it belongs to
+            return None, None, error
+
     def _initialize_statistics(self, media_files: List[Path]) -> dict:
         """Initialize the organization statistics dictionary."""
         return {
@@ -402,49 +1171,138 @@ class ImageVideoOrganizer:
             "errors": 0,
         }
 
-    def _should_skip_file(self, file_path: Path, processed_hashes: Set[str]) -> bool:
-        """Determine if a file should be skipped during organization."""
-        if self.destination_path in file_path.parents:
-            return True
+    def _should_skip_file(
+        self,
+        file_path: Path,
+        processed_hashes: Set[str],
+        duplicate_candidates: Set[Path],
+        file_statistics: Optional[os.stat_result] = None,
+    ) -> bool:
+        """
+        Determine if a file should be skipped during organization.
 
-        return self.is_duplicate(file_path, processed_hashes)
+        Files inside the destination are pruned by the scan and never get here.
+        """
+        # A file with a unique size/fingerprint cannot duplicate another one
+        if file_path not in duplicate_candidates:
+            return False
+
+        return self.is_duplicate(file_path, processed_hashes, file_statistics)
 
     def _process_single_file(
         self,
         file_path: Path,
         processed_hashes: Set[str],
         files_by_date: Dict[str, List[Path]],
-    ) -> dict:
-        """Process a single file for organization."""
-        creation_date = self.get_creation_date(file_path)
+        duplicate_candidates: Set[Path],
+        creation_date: Optional[datetime] = None,
+        file_statistics: Optional[os.stat_result] = None,
+    ) -> int:
+        """Process a single file for organization, returning a _RESULT_* code."""
+        if creation_date is None:
+            creation_date = self.get_creation_date(file_path)
         date_folder_name = self.format_date_folder(creation_date)
 
         destination_directory = self._create_date_directory(date_folder_name)
         unique_filename = self.generate_unique_filename(
-            destination_directory, file_path.name, file_path
+            destination_directory, file_path.name, file_path, file_statistics
         )
 
         if unique_filename is None:
-            return {"type": "duplicate"}
+            return _RESULT_DUPLICATE
 
         conflict_resolved = unique_filename != file_path.name
         final_destination_path = destination_directory / unique_filename
 
-        shutil.copy2(file_path, final_destination_path)
+        self._place_file(file_path, final_destination_path)
+        self._remember_file_name(destination_directory, unique_filename)
 
-        file_hash = self.calculate_file_hash(file_path)
-        processed_hashes.add(file_hash)
+        if file_path in duplicate_candidates:
+            file_hash = self._cached_file_hash(file_path, file_statistics)
+            processed_hashes.add(file_hash)
+            # The copy has the same content, so later conflicts need not hash it
+            self._remember_file_hash(final_destination_path, file_hash)
 
         self._track_file_by_date(
             files_by_date, date_folder_name, final_destination_path
         )
 
-        return {"type": "processed", "conflict_resolved": conflict_resolved}
+        return _RESULT_CONFLICT_RESOLVED if conflict_resolved else _RESULT_PROCESSED
+
+    def _place_file(self, source_path: Path, destination_path: Path):
+        """Put a source file at its destination according to the copy mode."""
+        if self.copy_mode == "hardlink":
+            try:
+                # A new directory entry for the same inode: no data is copied
+                os.link(source_path, destination_path)
+                return
+            except OSError:
+                # Different file system (or links unsupported): copy instead
+                pass
+
+        self._copy_file(source_path, destination_path)
+
+    def _copy_file(self, source_path: Path, destination_path: Path):
+        """
+        Copy a file with its metadata, letting the kernel move the data.
+
+        Tries a reflink (shares the data blocks on btrfs/xfs, no bytes
+        copied), then os.copy_file_range (in-kernel copy that can also
+        reflink or copy server-side), and falls back to shutil.copy2.
+        """
+        if not (_CAN_CLONE_FILES or hasattr(os, "copy_file_range")):
+            shutil.copy2(source_path, destination_path)
+            return
+
+        with (
+            open(source_path, "rb") as source_file,
+            open(destination_path, "wb") as destination_file,
+        ):
+            copied_in_kernel = self._copy_file_data(source_file, destination_file)
+
+        if copied_in_kernel:
+            shutil.copystat(source_path, destination_path)
+        else:
+            shutil.copy2(source_path, destination_path)
+
+    def _copy_file_data(self, source_file, destination_file) -> bool:
+        """Copy file contents in the kernel; False if the file system cannot."""
+        if _CAN_CLONE_FILES:
+            try:
+                fcntl.ioctl(destination_file.fileno(), _FICLONE, source_file.fileno())
+                return True
+            except OSError:
+                pass
+
+        if hasattr(os, "copy_file_range"):
+            remaining_bytes = os.fstat(source_file.fileno()).st_size
+            try:
+                while remaining_bytes > 0:
+                    copied_bytes = os.copy_file_range(
+                        source_file.fileno(), destination_file.fileno(), remaining_bytes
+                    )
+                    if copied_bytes == 0:
+                        break
+                    remaining_bytes -= copied_bytes
+            except OSError:
+                return False
+            return remaining_bytes == 0
+
+        return False
 
     def _create_date_directory(self, date_folder_name: str) -> Path:
-        """Create and return the destination directory for a specific date."""
-        destination_directory = self.destination_path / date_folder_name
-        destination_directory.mkdir(parents=True, exist_ok=True)
+        """
+        Create and return the destination directory for a specific date.
+
+        Each folder's Path is built and created once and then looked up by
+        name, so files sharing a date do not rebuild or re-create it.
+        """
+        destination_directory = self._date_directories.get(date_folder_name)
+        if destination_directory is None:
+            destination_directory = self.destination_path / date_folder_name
+            destination_directory.mkdir(parents=True, exist_ok=True)
+            self._directory_file_names(destination_directory)
+            self._date_directories[date_folder_name] = destination_directory
         return destination_directory
 
     def _track_file_by_date(
@@ -455,15 +1313,6 @@ class ImageVideoOrganizer:
             files_by_date[date_folder] = []
         files_by_date[date_folder].append(file_path)
 
-    def _update_statistics_from_file_result(self, statistics: dict, result: dict):
-        """Update statistics based on file processing result."""
-        if result["type"] == "duplicate":
-            statistics["duplicates_skipped"] += 1
-        elif result["type"] == "processed":
-            statistics["processed"] += 1
-            if result.get("conflict_resolved", False):
-                statistics["conflicts_resolved"] += 1
-
     def _finalize_statistics(
         self, statistics: dict, files_by_date: Dict[str, List[Path]]
     ):
@@ -475,6 +1324,17 @@ class ImageVideoOrganizer:
         }
 
 
+def _init_organize_worker(organizer: ImageVideoOrganizer):
+    """Keep the organizer that a pool worker uses for all its files."""
+    global _worker_organizer
+    _worker_organizer = organizer
+
+
+def _analyze_file(analysis_task: Tuple[Path, bool, bool]):
+    """Analyze one media file in a pool worker."""
+    return _worker_organizer._analyze_media_file(*analysis_task)
+
+
 def main():
     """Main entry point for the script."""
     command_line_parser = argparse.ArgumentParser(
@@ -486,12 +1346,38 @@ def main():
     command_line_parser.add_argument(
         "--destination", "-d", help="Destination path for organized files"
     )
+    command_line_parser.add_argument(
+        "--hash-algorithm",
+        choices=ImageVideoOrganizer.HASH_ALGORITHMS,
+        default="blake3",
+        help="Hash used for duplicate detection (default: blake3, or blake2b "
+        "when the blake3 package is not installed)",
+    )
+    command_line_parser.add_argument(
+        "--link",
+        "-L",
+        action="store_const",
+        const="hardlink",
+        default="copy",
+        dest="copy_mode",
+        help="Hard link files into the destination instead of copying them "
+        "(falls back to copying across file systems)",
+    )
+    command_line_parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of files to analyze in parallel (default: CPU count)",
+    )
 
     parsed_arguments = command_line_parser.parse_args()
 
     try:
         file_organizer = ImageVideoOrganizer(
-            parsed_arguments.source_path, parsed_arguments.destination
+            parsed_arguments.source_path,
+            parsed_arguments.destination,
+            parsed_arguments.hash_algorithm,
+            parsed_arguments.workers,
+            parsed_arguments.copy_mode,
         )
         organization_results = file_organizer.organize_files()
 
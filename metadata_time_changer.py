@@ -7,38 +7,150 @@ for images and videos using human-readable time adjustments.
 """
 
 import argparse
+import collections
+import functools
+import importlib.util
+import mmap
+import multiprocessing
 import os
 import re
 import shutil
 import struct
+import subprocess
 import sys
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 try:
     import piexif
-    from PIL import Image
-    from PIL.ExifTags import TAGS
 except ImportError:
-    Image = None
-    TAGS = None
     piexif = None
 
-try:
-    from pymediainfo import MediaInfo
-except ImportError:
-    MediaInfo = None
+# Pillow, pymediainfo and ffmpeg-python are imported on first use (see the
+# _load_* functions below) so runs that never need them do not pay for them
 
-try:
-    import subprocess
+from avi_riff_utils import find_idit_chunks, format_canon_date, parse_canon_date
 
-    import ffmpeg
-except ImportError:
-    ffmpeg = None
-    subprocess = None
+# (IFD, tag, field name) of the EXIF timestamps in a piexif dictionary
+if piexif:
+    _PIEXIF_TIMESTAMP_FIELDS = (
+        ("Exif", piexif.ExifIFD.DateTimeOriginal, "DateTimeOriginal"),
+        ("Exif", piexif.ExifIFD.DateTimeDigitized, "DateTimeDigitized"),
+        ("0th", piexif.ImageIFD.DateTime, "DateTime"),
+    )
+else:
+    _PIEXIF_TIMESTAMP_FIELDS = ()
+
+# Time adjustment terms like "2w" and the days per unit
+_TIME_ADJUSTMENT_PATTERN = re.compile(r"(\d+)([a-zA-Z])")
+_TIME_UNIT_DAYS = {
+    "y": 365,  # Approximate, ignoring leap years
+    "m": 30,  # Approximate month length
+    "w": 7,
+    "d": 1,
+    "h": 1 / 24,  # Hours as a fraction of a day
+}
+
+# 'YYYY:MM:DD HH:MM:SS' as stored in EXIF, as text (PIL) or bytes (piexif)
+_EXIF_DATETIME_PATTERN = re.compile(r"(\d{4}):(\d{2}):(\d{2}) (\d{2}):(\d{2}):(\d{2})")
+_EXIF_DATETIME_BYTES_PATTERN = re.compile(
+    rb"(\d{4}):(\d{2}):(\d{2}) (\d{2}):(\d{2}):(\d{2})"
+)
+# 'YYYY-MM-DD HH:MM:SS UTC' and 'YYYY-MM-DDTHH:MM:SSZ' from video metadata
+_VIDEO_DATETIME_PATTERN = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?: UTC|Z)?"
+)
+
+# Common video timestamp fields of the MediaInfo general track
+_VIDEO_TIMESTAMP_FIELDS = (
+    "recorded_date",
+    "tagged_date",
+    "encoded_date",
+    "mastered_date",
+    "file_last_modification_date",
+    "creation_time",
+    "date",
+)
+
+# MP4/MOV containers whose header times can be patched in place
+_MP4_CONTAINER_EXTENSIONS = {".mp4", ".mov", ".m4v"}
+_MP4_ATOM_HEADER = struct.Struct(">L4s")
+_MP4_EPOCH = datetime(1904, 1, 1)
+# Creation and modification time of mvhd/tkhd/mdhd, by header version
+_MP4_HEADER_TIMES = {0: struct.Struct(">LL"), 1: struct.Struct(">QQ")}
+
+# Which stat field holds the creation time differs per platform
+_HAS_BIRTHTIME = hasattr(os.stat_result, "st_birthtime")  # macOS
+_IS_WINDOWS = os.name == "nt"  # st_ctime is the creation time
+
+# Media kinds, worked out once per file from its extension
+_MEDIA_KIND_IMAGE = 0
+_MEDIA_KIND_VIDEO = 1
+
+# Changer used by a process pool worker, set once per worker by the initializer
+_worker_changer = None
+
+# Photo workers start while video threads are already running in this
+# process, and forking a multi-threaded process can deadlock the child, so
+# workers are started from a clean server process (or spawned) instead
+_PROCESS_POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_exif_datetime(date_string: Union[str, bytes]) -> Optional[datetime]:
+    """
+    Parse 'YYYY:MM:DD HH:MM:SS' from EXIF text or bytes.
+
+    Cached because photos from a burst often share the same timestamp.
+    """
+    if isinstance(date_string, bytes):
+        date_match = _EXIF_DATETIME_BYTES_PATTERN.fullmatch(date_string)
+    else:
+        date_match = _EXIF_DATETIME_PATTERN.fullmatch(date_string)
+    if date_match is None:
+        return None
 
-from avi_riff_utils import find_idit_chunk, format_canon_date, parse_canon_date
+    try:
+        return datetime(*map(int, date_match.groups()))
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _load_pil_exif():
+    """Import Pillow's Image and EXIF tag names, or (None, None) if missing."""
+    try:
+        from PIL import Image
+        from PIL.ExifTags import TAGS
+    except ImportError:
+        return None, None
+    return Image, TAGS
+
+
+@functools.lru_cache(maxsize=None)
+def _load_media_info():
+    """Import pymediainfo's MediaInfo, or None if it is not installed."""
+    try:
+        from pymediainfo import MediaInfo
+    except ImportError:
+        return None
+    return MediaInfo
+
+
+@functools.lru_cache(maxsize=None)
+def _has_ffmpeg_python() -> bool:
+    """Check that ffmpeg-python is installed without importing it."""
+    return importlib.util.find_spec("ffmpeg") is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _find_ffmpeg_binary() -> Optional[str]:
+    """Locate the ffmpeg binary once instead of searching PATH for every video."""
+    return shutil.which("ffmpeg")
 
 
 class TimeParsingError(Exception):
@@ -62,6 +174,10 @@ class MetadataTimeChanger:
         ".webp",
     }
     VIDEO_EXTENSIONS = {".mp4", ".mov", ".avi", ".mkv", ".wmv", ".flv", ".webm", ".m4v"}
+    _EXTENSION_KINDS = {
+        **dict.fromkeys(IMAGE_EXTENSIONS, _MEDIA_KIND_IMAGE),
+        **dict.fromkeys(VIDEO_EXTENSIONS, _MEDIA_KIND_VIDEO),
+    }
 
     def __init__(self, source_path: str, time_adjustment: str, dry_run: bool = False):
         """
@@ -116,8 +232,7 @@ class MetadataTimeChanger:
             return timedelta(days=days if is_positive else -days)
 
         # Parse complex format like "1y 2m 3d 4w 5h"
-        pattern = r"(\d+)([a-zA-Z])"
-        matches = re.findall(pattern, time_string.lower())
+        matches = _TIME_ADJUSTMENT_PATTERN.findall(time_string.lower())
 
         if not matches:
             raise TimeParsingError(f"Invalid time format: {time_string}")
@@ -125,20 +240,10 @@ class MetadataTimeChanger:
         total_days = 0
 
         for value_str, unit in matches:
-            value = int(value_str)
-
-            if unit == "y":  # years
-                total_days += value * 365  # Approximate, ignoring leap years
-            elif unit == "m":  # months
-                total_days += value * 30  # Approximate month length
-            elif unit == "w":  # weeks
-                total_days += value * 7
-            elif unit == "d":  # days
-                total_days += value
-            elif unit == "h":  # hours (convert to fraction of days)
-                total_days += value / 24
-            else:
+            unit_days = _TIME_UNIT_DAYS.get(unit)
+            if unit_days is None:
                 raise TimeParsingError(f"Unsupported time unit: {unit}")
+            total_days += int(value_str) * unit_days
 
         return timedelta(days=total_days if is_positive else -total_days)
 
@@ -149,22 +254,48 @@ class MetadataTimeChanger:
         Returns:
             List of Path objects for found media files
         """
-        discovered_media_files = []
-        all_supported_extensions = self.IMAGE_EXTENSIONS | self.VIDEO_EXTENSIONS
+        return list(self.iter_media_files())
 
-        for current_file_path in self.source_path.rglob("*"):
-            if self._is_supported_media_file(
-                current_file_path, all_supported_extensions
-            ):
-                discovered_media_files.append(current_file_path)
+    def iter_media_files(self) -> Iterator[Path]:
+        """
+        Yield supported image and video files as the tree is walked.
+
+        Returns:
+            Iterator of Path objects for found media files
+        """
+        for file_path, _ in self._iter_media_file_kinds():
+            yield file_path
 
-        return discovered_media_files
+    def _iter_media_file_kinds(self) -> Iterator[Tuple[Path, int]]:
+        """Yield supported media files together with their media kind."""
+        for file_path, kind in self._scandir_recursive(str(self.source_path)):
+            yield Path(file_path), kind
 
-    def _is_supported_media_file(
-        self, file_path: Path, supported_extensions: set
-    ) -> bool:
-        """Check if a file is a supported media file."""
-        return file_path.is_file() and file_path.suffix.lower() in supported_extensions
+    def _scandir_recursive(self, directory_path: str) -> Iterator[Tuple[str, int]]:
+        """
+        Yield (path, kind) for the supported media files below a directory.
+
+        Uses os.scandir so file type checks come from the cached directory
+        entry instead of a stat() call per file.
+        """
+        extension_kinds = self._EXTENSION_KINDS
+
+        try:
+            with os.scandir(directory_path) as directory_entries:
+                for directory_entry in directory_entries:
+                    if directory_entry.is_dir(follow_symlinks=False):
+                        yield from self._scandir_recursive(directory_entry.path)
+                        continue
+
+                    kind = extension_kinds.get(
+                        os.path.splitext(directory_entry.name)[1].lower()
+                    )
+                    if kind is not None and directory_entry.is_file(
+                        follow_symlinks=False
+                    ):
+                        yield directory_entry.path, kind
+        except PermissionError:
+            pass
 
     def read_photo_metadata_timestamps(
         self, file_path: Path
@@ -178,7 +309,14 @@ class MetadataTimeChanger:
         Returns:
             Dictionary with timestamp field names and their datetime values
         """
+        return self._read_photo_metadata(file_path)[0]
+
+    def _read_photo_metadata(
+        self, file_path: Path
+    ) -> Tuple[Dict[str, Optional[datetime]], Optional[dict]]:
+        """Read photo timestamps along with the piexif dictionary they came from."""
         timestamps = {}
+        exif_dict = None
 
         # Try reading EXIF data with piexif
         if piexif:
@@ -188,16 +326,23 @@ class MetadataTimeChanger:
             except Exception as e:
                 self.errors.append(f"Could not read EXIF from {file_path}: {e}")
 
-        # Also try with PIL for additional metadata
-        if Image and TAGS:
+        # Fall back to PIL only when piexif found nothing (e.g. formats piexif
+        # cannot load), so the file is not opened and parsed twice
+        if all(value is None for value in timestamps.values()):
+            pil_image, exif_tag_names = _load_pil_exif()
+        else:
+            pil_image = exif_tag_names = None
+        if pil_image and exif_tag_names:
             try:
-                with Image.open(file_path) as image:
+                with pil_image.open(file_path) as image:
                     exif_data = image.getexif()
-                    timestamps.update(self._extract_exif_timestamps_pil(exif_data))
+                    timestamps.update(
+                        self._extract_exif_timestamps_pil(exif_data, exif_tag_names)
+                    )
             except Exception as e:
                 self.errors.append(f"Could not read PIL EXIF from {file_path}: {e}")
 
-        return timestamps
+        return timestamps, exif_dict
 
     def _extract_exif_timestamps_piexif(
         self, exif_dict: dict
@@ -205,34 +350,21 @@ class MetadataTimeChanger:
         """Extract timestamp fields from piexif EXIF dictionary."""
         timestamps = {}
 
-        # EXIF timestamp fields to check
-        exif_fields = {
-            piexif.ExifIFD.DateTimeOriginal: "DateTimeOriginal",
-            piexif.ExifIFD.DateTimeDigitized: "DateTimeDigitized",
-            piexif.ImageIFD.DateTime: "DateTime",
-        }
+        for ifd_name, field_id, field_name in _PIEXIF_TIMESTAMP_FIELDS:
+            ifd = exif_dict.get(ifd_name)
+            field_value = ifd.get(field_id) if ifd else None
+            if field_value is None:
+                continue
 
-        for field_id, field_name in exif_fields.items():
             try:
-                # Check in EXIF IFD
-                if "Exif" in exif_dict and field_id in exif_dict["Exif"]:
-                    date_str = exif_dict["Exif"][field_id].decode("utf-8")
-                    timestamps[field_name] = self._parse_exif_datetime_string(date_str)
-                # Check in Image IFD for DateTime
-                elif (
-                    field_id == piexif.ImageIFD.DateTime
-                    and "0th" in exif_dict
-                    and field_id in exif_dict["0th"]
-                ):
-                    date_str = exif_dict["0th"][field_id].decode("utf-8")
-                    timestamps[field_name] = self._parse_exif_datetime_string(date_str)
+                timestamps[field_name] = self._parse_exif_datetime_string(field_value)
             except Exception:
                 timestamps[field_name] = None
 
         return timestamps
 
     def _extract_exif_timestamps_pil(
-        self, exif_data: dict
+        self, exif_data: dict, exif_tag_names: dict
     ) -> Dict[str, Optional[datetime]]:
         """Extract timestamp fields from PIL EXIF data."""
         timestamps = {}
@@ -240,18 +372,17 @@ class MetadataTimeChanger:
         target_tags = ["DateTime", "DateTimeOriginal", "DateTimeDigitized"]
 
         for tag_id, value in exif_data.items():
-            tag_name = TAGS.get(tag_id, str(tag_id))
+            tag_name = exif_tag_names.get(tag_id, str(tag_id))
             if tag_name in target_tags and tag_name not in timestamps:
                 timestamps[tag_name] = self._parse_exif_datetime_string(str(value))
 
         return timestamps
 
-    def _parse_exif_datetime_string(self, date_string: str) -> Optional[datetime]:
-        """Parse EXIF datetime string to datetime object."""
-        try:
-            return datetime.strptime(date_string, "%Y:%m:%d %H:%M:%S")
-        except ValueError:
-            return None
+    def _parse_exif_datetime_string(
+        self, date_string: Union[str, bytes]
+    ) -> Optional[datetime]:
+        """Parse EXIF datetime string (or raw EXIF bytes) to datetime object."""
+        return _parse_exif_datetime(date_string)
 
     def read_video_metadata_timestamps(
         self, file_path: Path
@@ -267,28 +398,21 @@ class MetadataTimeChanger:
         """
         timestamps = {}
 
-        if not MediaInfo:
+        media_info_class = _load_media_info()
+        if not media_info_class:
             return timestamps
 
         try:
-            media_info = MediaInfo.parse(str(file_path))
+            media_info = media_info_class.parse(str(file_path))
 
             for track in media_info.tracks:
                 if track.track_type == "General":
-                    # Common video timestamp fields
-                    timestamp_fields = [
-                        "recorded_date",
-                        "tagged_date",
-                        "encoded_date",
-                        "mastered_date",
-                        "file_last_modification_date",
-                        "creation_time",
-                        "date",
-                    ]
-
-                    for field_name in timestamp_fields:
+                    # One dict of the track's fields instead of a getattr each
+                    track_data = track.to_data()
+
+                    for field_name in _VIDEO_TIMESTAMP_FIELDS:
                         try:
-                            field_value = getattr(track, field_name, None)
+                            field_value = track_data.get(field_name)
                             if field_value:
                                 timestamps[field_name] = (
                                     self._parse_video_datetime_string(str(field_value))
@@ -305,6 +429,13 @@ class MetadataTimeChanger:
 
     def _parse_video_datetime_string(self, date_string: str) -> Optional[datetime]:
         """Parse video metadata datetime string to datetime object."""
+        date_match = _VIDEO_DATETIME_PATTERN.fullmatch(date_string)
+        if date_match is not None:
+            try:
+                return datetime(*map(int, date_match.groups()))
+            except ValueError:
+                return None
+
         try:
             # Handle UTC timestamp format
             if "UTC" in date_string:
@@ -327,16 +458,22 @@ class MetadataTimeChanger:
         Returns:
             Dictionary with file system timestamp names and values
         """
-        file_stat = file_path.stat()
+        return self._read_file_system_timestamps(file_path)[0]
+
+    def _read_file_system_timestamps(
+        self, file_path: Path
+    ) -> Tuple[Dict[str, datetime], int]:
+        """Get file system timestamps plus the raw modification time in ns."""
+        file_stat = os.stat(file_path)
         timestamps = {"modification_time": datetime.fromtimestamp(file_stat.st_mtime)}
 
         # Add creation time if available
-        if hasattr(file_stat, "st_birthtime"):  # macOS
+        if _HAS_BIRTHTIME:  # macOS
             timestamps["creation_time"] = datetime.fromtimestamp(file_stat.st_birthtime)
-        elif os.name == "nt":  # Windows
+        elif _IS_WINDOWS:
             timestamps["creation_time"] = datetime.fromtimestamp(file_stat.st_ctime)
 
-        return timestamps
+        return timestamps, file_stat.st_mtime_ns
 
     def adjust_timestamps(
         self, timestamps: Dict[str, Optional[datetime]]
@@ -350,6 +487,21 @@ class MetadataTimeChanger:
         Returns:
             Dictionary with adjusted timestamp values
         """
+        time_delta = self.time_delta
+        try:
+            return {
+                field_name: (
+                    timestamp_value + time_delta
+                    if timestamp_value is not None
+                    else None
+                )
+                for field_name, timestamp_value in timestamps.items()
+            }
+        except Exception:
+            # Rare (e.g. a date pushed past year 9999): redo it field by field
+            # below so each failing field is reported and keeps its value
+            pass
+
         adjusted_timestamps = {}
 
         for field_name, timestamp_value in timestamps.items():
@@ -365,7 +517,10 @@ class MetadataTimeChanger:
         return adjusted_timestamps
 
     def write_photo_metadata_timestamps(
-        self, file_path: Path, timestamps: Dict[str, Optional[datetime]]
+        self,
+        file_path: Path,
+        timestamps: Dict[str, Optional[datetime]],
+        exif_dict: Optional[dict] = None,
     ) -> bool:
         """
         Write adjusted timestamps back to photo metadata.
@@ -373,6 +528,8 @@ class MetadataTimeChanger:
         Args:
             file_path: Path to the photo file
             timestamps: Dictionary with adjusted timestamp values
+            exif_dict: piexif dictionary already read from the file, if any
+                (loaded from the file otherwise); it is updated in place
 
         Returns:
             True if successful, False otherwise
@@ -384,24 +541,17 @@ class MetadataTimeChanger:
             return False
 
         try:
-            # Load existing EXIF data
-            exif_dict = piexif.load(str(file_path))
+            # Load existing EXIF data unless the reader already did
+            if exif_dict is None:
+                exif_dict = piexif.load(str(file_path))
 
             # Update timestamp fields
-            for field_name, timestamp_value in timestamps.items():
+            for ifd_name, field_id, field_name in _PIEXIF_TIMESTAMP_FIELDS:
+                timestamp_value = timestamps.get(field_name)
                 if timestamp_value is not None:
-                    formatted_timestamp = timestamp_value.strftime("%Y:%m:%d %H:%M:%S")
-
-                    if field_name == "DateTimeOriginal":
-                        exif_dict["Exif"][
-                            piexif.ExifIFD.DateTimeOriginal
-                        ] = formatted_timestamp
-                    elif field_name == "DateTimeDigitized":
-                        exif_dict["Exif"][
-                            piexif.ExifIFD.DateTimeDigitized
-                        ] = formatted_timestamp
-                    elif field_name == "DateTime":
-                        exif_dict["0th"][piexif.ImageIFD.DateTime] = formatted_timestamp
+                    exif_dict[ifd_name][field_id] = timestamp_value.strftime(
+                        "%Y:%m:%d %H:%M:%S"
+                    )
 
             # Write back to file
             exif_bytes = piexif.dump(exif_dict)
@@ -414,7 +564,10 @@ class MetadataTimeChanger:
             return False
 
     def write_video_metadata_timestamps(
-        self, file_path: Path, timestamps: Dict[str, Optional[datetime]]
+        self,
+        file_path: Path,
+        timestamps: Dict[str, Optional[datetime]],
+        naive_times_are_local: bool = False,
     ) -> bool:
         """
         Write adjusted timestamps back to video metadata.
@@ -424,6 +577,8 @@ class MetadataTimeChanger:
         Args:
             file_path: Path to the video file
             timestamps: Dictionary with adjusted timestamp values
+            naive_times_are_local: True if naive timestamps are local time
+                (e.g. taken from the file system) rather than UTC metadata
 
         Returns:
             True if successful, False otherwise
@@ -455,9 +610,182 @@ class MetadataTimeChanger:
                 file_path, primary_timestamp
             )
 
+        # Patch MP4/MOV header times in place when possible instead of remuxing
+        if file_path.suffix.lower() in _MP4_CONTAINER_EXTENSIONS:
+            patched = self.write_mp4_metadata_inplace(
+                file_path, primary_timestamp, naive_times_are_local
+            )
+            if patched is not None:
+                return patched
+
         # Use ffmpeg for other video formats
         return self.write_video_metadata_with_ffmpeg(file_path, primary_timestamp)
 
+    def write_mp4_metadata_inplace(
+        self, file_path: Path, timestamp: datetime, naive_time_is_local: bool = False
+    ) -> Optional[bool]:
+        """
+        Overwrite the creation and modification times in the MP4/MOV headers.
+
+        The mvhd, tkhd and mdhd atoms store these times as fixed-size fields,
+        so they are patched in place (as ffmpeg would set them) without
+        copying the whole file. Files that also carry a ©day date tag are
+        left to ffmpeg, which rewrites that tag as well.
+
+        The header fields are UTC. Naive times read from the video metadata
+        are already UTC and are written as they are; a naive time that came
+        from the file system (no metadata time, e.g. without pymediainfo) is
+        local time and is converted with the local time zone first.
+
+        Args:
+            file_path: Path to the MP4/MOV file
+            timestamp: Adjusted timestamp to write
+            naive_time_is_local: True if a naive timestamp is local time
+
+        Returns:
+            True if successful, False on failure, or None if the file cannot
+            be patched in place and needs ffmpeg
+        """
+        if timestamp.tzinfo is None and naive_time_is_local:
+            timestamp = timestamp.astimezone()  # Attach the local time zone
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+        mp4_seconds = int((timestamp - _MP4_EPOCH).total_seconds())
+        if mp4_seconds <= 0:
+            return None
+
+        try:
+            with open(file_path, "r+b") as file_handle:
+                file_size = os.fstat(file_handle.fileno()).st_size
+                movie_atom = self._find_mp4_atom(file_handle, b"moov", 0, file_size)
+                if movie_atom is None:
+                    return None
+
+                # The movie atom only holds headers and sample tables, so it is
+                # small enough to read in one go even for long recordings
+                movie_start, movie_end = movie_atom
+                file_handle.seek(movie_start)
+                movie_data = file_handle.read(movie_end - movie_start)
+                if b"\xa9day" in movie_data:
+                    return None
+
+                time_patches = []
+                for header_start, header_end in self._find_mp4_time_headers(movie_data):
+                    # Each time field takes half the struct: 32 or 64 bits
+                    header_times = _MP4_HEADER_TIMES.get(movie_data[header_start])
+                    if (
+                        header_times is None
+                        or header_start + 4 + header_times.size > header_end
+                        or mp4_seconds >= 1 << (header_times.size * 4)
+                    ):
+                        return None
+                    time_patches.append(
+                        (
+                            movie_start + header_start + 4,
+                            header_times.pack(mp4_seconds, mp4_seconds),
+                        )
+                    )
+
+                if not time_patches:
+                    return None
+                if self.dry_run:
+                    return True
+
+                for patch_offset, patch_bytes in time_patches:
+                    file_handle.seek(patch_offset)
+                    file_handle.write(patch_bytes)
+                file_handle.flush()
+                os.fsync(file_handle.fileno())
+
+            return True
+
+        except (OSError, struct.error) as e:
+            self.errors.append(f"Could not patch MP4 header times in {file_path}: {e}")
+            return False
+
+    def _find_mp4_atom(
+        self, file_handle, atom_type: bytes, start: int, end: int
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Find the first atom of a type between two offsets by walking headers.
+
+        Large atoms such as mdat are seeked over rather than read, so the
+        movie atom is found even when it sits at the end of the file.
+
+        Returns:
+            Tuple of (payload_start, payload_end) or None if not found
+        """
+        atom_offset = start
+        while atom_offset + _MP4_ATOM_HEADER.size <= end:
+            file_handle.seek(atom_offset)
+            atom_header = file_handle.read(_MP4_ATOM_HEADER.size)
+            if len(atom_header) < _MP4_ATOM_HEADER.size:
+                return None
+
+            atom_size, current_atom_type = _MP4_ATOM_HEADER.unpack(atom_header)
+            header_size = _MP4_ATOM_HEADER.size
+            if atom_size == 1:  # 64-bit size follows the type
+                atom_size = struct.unpack(">Q", file_handle.read(8))[0]
+                header_size += 8
+            elif atom_size == 0:  # Atom extends to the end
+                atom_size = end - atom_offset
+
+            if atom_size < header_size:
+                return None
+            if current_atom_type == atom_type:
+                return atom_offset + header_size, min(atom_offset + atom_size, end)
+
+            atom_offset += atom_size
+
+        return None
+
+    def _iter_mp4_atoms(
+        self, data: bytes, start: int, end: int
+    ) -> Iterator[Tuple[bytes, int, int]]:
+        """Yield (atom_type, payload_start, payload_end) for atoms in a buffer."""
+        atom_offset = start
+        while atom_offset + _MP4_ATOM_HEADER.size <= end:
+            atom_size, atom_type = _MP4_ATOM_HEADER.unpack_from(data, atom_offset)
+            header_size = _MP4_ATOM_HEADER.size
+            if atom_size == 1:  # 64-bit size follows the type
+                if atom_offset + 16 > end:
+                    return
+                atom_size = struct.unpack_from(">Q", data, atom_offset + 8)[0]
+                header_size += 8
+            elif atom_size == 0:  # Atom extends to the end
+                atom_size = end - atom_offset
+
+            if atom_size < header_size:
+                return
+            yield atom_type, atom_offset + header_size, min(
+                atom_offset + atom_size, end
+            )
+            atom_offset += atom_size
+
+    def _find_mp4_time_headers(self, movie_data: bytes) -> List[Tuple[int, int]]:
+        """Find the mvhd, tkhd and mdhd payloads inside the movie atom."""
+        time_headers = []
+        for atom_type, start, end in self._iter_mp4_atoms(
+            movie_data, 0, len(movie_data)
+        ):
+            if atom_type == b"mvhd":
+                time_headers.append((start, end))
+            elif atom_type == b"trak":
+                for track_atom_type, track_start, track_end in self._iter_mp4_atoms(
+                    movie_data, start, end
+                ):
+                    if track_atom_type == b"tkhd":
+                        time_headers.append((track_start, track_end))
+                    elif track_atom_type == b"mdia":
+                        time_headers.extend(
+                            (media_start, media_end)
+                            for media_atom_type, media_start, media_end in (
+                                self._iter_mp4_atoms(movie_data, track_start, track_end)
+                            )
+                            if media_atom_type == b"mdhd"
+                        )
+        return time_headers
+
     def write_video_metadata_with_ffmpeg(
         self, file_path: Path, timestamp: datetime
     ) -> bool:
@@ -472,32 +800,33 @@ class MetadataTimeChanger:
         Returns:
             True if successful, False otherwise
         """
-        if not ffmpeg or not subprocess:
+        if not _has_ffmpeg_python():
             self.errors.append(
                 f"ffmpeg not available for writing video metadata to {file_path}"
             )
             return False
 
         # Check if ffmpeg is installed on the system
-        if not shutil.which("ffmpeg"):
+        ffmpeg_binary = _find_ffmpeg_binary()
+        if not ffmpeg_binary:
             self.errors.append(
                 f"ffmpeg binary not found - cannot modify video metadata for {file_path}"
             )
             return False
 
-        try:
-            if self.dry_run:
-                return True
+        if self.dry_run:
+            return True
 
-            # Create temporary output file
-            temp_output = file_path.with_suffix(f".tmp{file_path.suffix}")
+        # Create temporary output file
+        temp_output = file_path.with_suffix(f".tmp{file_path.suffix}")
 
+        try:
             # Format timestamp for video metadata
             formatted_timestamp = timestamp.strftime("%Y-%m-%dT%H:%M:%S")
 
             # Build ffmpeg command that preserves existing metadata
             cmd = [
-                "ffmpeg",
+                ffmpeg_binary,
                 "-i",
                 str(file_path),
                 "-c",
@@ -513,38 +842,24 @@ class MetadataTimeChanger:
             ]
 
             # Execute ffmpeg
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-
-            # Replace original file with modified version
-            if temp_output.exists():
-                # Create backup
-                backup_file = file_path.with_suffix(f".backup{file_path.suffix}")
-                file_path.rename(backup_file)
-
-                # Move new file to original location
-                temp_output.rename(file_path)
+            subprocess.run(cmd, capture_output=True, text=True, check=True)
 
-                # Remove backup
-                backup_file.unlink()
-
-                return True
-            else:
-                self.errors.append(
-                    f"ffmpeg failed to create output file for {file_path}"
-                )
-                return False
+            # Atomically replace the original with the modified version; the
+            # original stays intact until the new file is complete
+            os.replace(temp_output, file_path)
+            return True
 
         except subprocess.CalledProcessError as e:
             self.errors.append(f"ffmpeg command failed for {file_path}: {e.stderr}")
-            return False
         except Exception as e:
             self.errors.append(f"Failed to write video metadata to {file_path}: {e}")
-            return False
-        finally:
-            # Clean up temporary files if they exist
-            temp_output = file_path.with_suffix(f".tmp{file_path.suffix}")
-            if temp_output.exists():
-                temp_output.unlink()
+
+        # Clean up a partial temporary file left by the failed run
+        try:
+            temp_output.unlink()
+        except FileNotFoundError:
+            pass
+        return False
 
     def set_file_system_timestamps(
         self, file_path: Path, timestamps: Dict[str, datetime]
@@ -589,12 +904,42 @@ class MetadataTimeChanger:
             )
             return False
 
-    def process_single_file(self, file_path: Path) -> Dict[str, any]:
+    def _shift_file_system_timestamps(self, file_path: Path, mtime_ns: int) -> bool:
+        """
+        Set access and modification time to the shifted original mtime.
+
+        Same result as set_file_system_timestamps() with the adjusted
+        modification time: the shift is applied to the local wall-clock time,
+        like the metadata shifts, so a shift across a DST change keeps the
+        time of day. The sub-second part of the original stat() nanoseconds
+        is carried over so no precision is lost.
+        """
+        try:
+            whole_seconds, sub_second_ns = divmod(mtime_ns, 1_000_000_000)
+            adjusted_mtime = datetime.fromtimestamp(whole_seconds) + self.time_delta
+            adjusted_mtime_ns = (
+                int(adjusted_mtime.replace(microsecond=0).timestamp()) * 1_000_000_000
+                + adjusted_mtime.microsecond * 1000
+                + sub_second_ns
+            )
+            os.utime(file_path, ns=(adjusted_mtime_ns, adjusted_mtime_ns))
+            return True
+
+        except Exception as e:
+            self.errors.append(
+                f"Could not set file system timestamps for {file_path}: {e}"
+            )
+            return False
+
+    def process_single_file(
+        self, file_path: Path, kind: Optional[int] = None
+    ) -> Dict[str, any]:
         """
         Process a single media file: read timestamps, adjust them, and write back.
 
         Args:
             file_path: Path to the media file
+            kind: Media kind of the file, worked out from its extension if not given
 
         Returns:
             Dictionary with processing results
@@ -608,20 +953,29 @@ class MetadataTimeChanger:
             "adjusted_timestamps": {},
         }
 
+        file_extension = file_path.suffix.lower()
+        if kind is None:
+            kind = self._EXTENSION_KINDS.get(file_extension)
+
+        # piexif dictionary of a photo, kept so writing does not load it again
+        photo_exif_dict = None
+
         try:
             # Read current timestamps
-            if file_path.suffix.lower() in self.IMAGE_EXTENSIONS:
-                original_metadata_timestamps = self.read_photo_metadata_timestamps(
-                    file_path
+            if kind == _MEDIA_KIND_IMAGE:
+                original_metadata_timestamps, photo_exif_dict = (
+                    self._read_photo_metadata(file_path)
                 )
-            elif file_path.suffix.lower() in self.VIDEO_EXTENSIONS:
+            elif kind == _MEDIA_KIND_VIDEO:
                 original_metadata_timestamps = self.read_video_metadata_timestamps(
                     file_path
                 )
             else:
                 original_metadata_timestamps = {}
 
-            original_filesystem_timestamps = self.get_file_system_timestamps(file_path)
+            original_filesystem_timestamps, original_mtime_ns = (
+                self._read_file_system_timestamps(file_path)
+            )
 
             result["original_timestamps"] = {
                 "metadata": original_metadata_timestamps,
@@ -661,29 +1015,33 @@ class MetadataTimeChanger:
             # For AVI files, always try to write metadata even if none existed originally
             should_write_metadata = any(
                 ts is not None for ts in adjusted_metadata_timestamps.values()
-            ) or (file_path.suffix.lower() == ".avi")
+            ) or (file_extension == ".avi")
 
             if should_write_metadata:
-                if file_path.suffix.lower() in self.IMAGE_EXTENSIONS:
+                if kind == _MEDIA_KIND_IMAGE:
                     result["metadata_updated"] = self.write_photo_metadata_timestamps(
-                        file_path, adjusted_metadata_timestamps
+                        file_path, adjusted_metadata_timestamps, photo_exif_dict
                     )
-                elif file_path.suffix.lower() in self.VIDEO_EXTENSIONS:
-                    # For videos with no existing metadata, use adjusted filesystem time
-                    if all(ts is None for ts in adjusted_metadata_timestamps.values()):
+                elif kind == _MEDIA_KIND_VIDEO:
+                    # For videos with no existing metadata, use adjusted filesystem
+                    # time, which is local time rather than UTC like metadata times
+                    from_file_system = all(
+                        ts is None for ts in adjusted_metadata_timestamps.values()
+                    )
+                    if from_file_system:
                         adjusted_metadata_timestamps["creation_time"] = (
                             adjusted_filesystem_timestamps["modification_time"]
                         )
 
                     result["metadata_updated"] = self.write_video_metadata_timestamps(
-                        file_path, adjusted_metadata_timestamps
+                        file_path, adjusted_metadata_timestamps, from_file_system
                     )
                 else:
                     result["metadata_updated"] = False
 
             # Set file system timestamps
-            result["filesystem_updated"] = self.set_file_system_timestamps(
-                file_path, adjusted_filesystem_timestamps
+            result["filesystem_updated"] = self._shift_file_system_timestamps(
+                file_path, original_mtime_ns
             )
 
             result["processed"] = True
@@ -694,6 +1052,80 @@ class MetadataTimeChanger:
 
         return result
 
+    def process_all(self, workers: Optional[int] = None) -> List[Dict[str, any]]:
+        """
+        Find and process all media files, several files at a time.
+
+        Args:
+            workers: Maximum number of parallel workers (defaults to CPU count)
+
+        Returns:
+            List of processing results, in the order the files were found
+        """
+        return list(self.iter_processed_files(workers))
+
+    def iter_processed_files(
+        self, workers: Optional[int] = None
+    ) -> Iterator[Dict[str, any]]:
+        """
+        Process media files while the tree is still being walked.
+
+        Photos are processed in worker processes. Videos spend their time in
+        ffmpeg subprocesses and AVI file I/O, so they are processed on threads
+        alongside the photos instead of paying for pickling. Files are
+        submitted while the walk goes on, with at most twice the worker count
+        in flight, and results are yielded in discovery order as they finish.
+
+        Args:
+            workers: Maximum number of parallel workers (defaults to CPU count)
+
+        Yields:
+            Processing results, in the order the files were found
+        """
+        media_files = self._iter_media_file_kinds()
+        max_workers = workers or os.cpu_count() or 1
+
+        if max_workers == 1:
+            for file_path, kind in media_files:
+                yield self.process_single_file(file_path, kind)
+            return
+
+        # Workers build their own changer, so they never share this one's
+        # error list with the video threads
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=_PROCESS_POOL_CONTEXT,
+            initializer=_init_changer_worker,
+            initargs=(str(self.source_path), self.time_adjustment_string, self.dry_run),
+        ) as process_pool:
+            with ThreadPoolExecutor(max_workers=max_workers) as thread_pool:
+                pending_files = collections.deque()
+                max_pending_files = 2 * max_workers
+
+                for file_path, kind in media_files:
+                    if kind == _MEDIA_KIND_IMAGE:
+                        future = process_pool.submit(_process_file, file_path, kind)
+                    else:
+                        future = thread_pool.submit(
+                            self.process_single_file, file_path, kind
+                        )
+                    pending_files.append((kind == _MEDIA_KIND_IMAGE, future))
+
+                    if len(pending_files) >= max_pending_files:
+                        yield self._collect_result(*pending_files.popleft())
+
+                while pending_files:
+                    yield self._collect_result(*pending_files.popleft())
+
+    def _collect_result(self, in_worker_process: bool, future) -> Dict[str, any]:
+        """Wait for a submitted file and merge a worker's errors into ours."""
+        if not in_worker_process:
+            return future.result()
+
+        result, worker_errors = future.result()
+        self.errors.extend(worker_errors)
+        return result
+
     def write_avi_metadata_safe_inplace_modify(
         self, file_path: Path, timestamp: datetime
     ) -> bool:
@@ -712,72 +1144,63 @@ class MetadataTimeChanger:
             if self.dry_run:
                 return True
 
-            # Import required modules
-            import shutil
-
-            # Create backup first
-            backup_path = file_path.with_suffix(".backup.avi")
-            shutil.copy2(file_path, backup_path)
-
-            try:
-                # Read the entire file
-                with open(file_path, "rb") as f:
-                    data = bytearray(f.read())
-
-                # Find IDIT chunk
-                idit_pos, date_data = find_idit_chunk(data)
-                if idit_pos is None:
-                    self.errors.append(f"No IDIT chunk found in {file_path}")
-                    # Clean up backup before returning
-                    if backup_path.exists():
-                        backup_path.unlink()
-                    return False
-
-                # Parse current date
-                current_date_str = date_data.decode("ascii", errors="ignore")
-                current_date = parse_canon_date(current_date_str)
-                if current_date is None:
-                    self.errors.append(
-                        f"Could not parse current date '{current_date_str.strip()}' in {file_path}"
-                    )
-                    if backup_path.exists():
-                        backup_path.unlink()
-                    return False
-
-                # Calculate new date (use the provided timestamp)
-                new_date_str = format_canon_date(timestamp)
-                new_date_bytes = new_date_str.encode("ascii")
-
-                # Pad or truncate to match original chunk size
-                original_size = len(date_data)
-                if len(new_date_bytes) < original_size:
-                    # Pad with null bytes
-                    new_date_bytes += b"\x00" * (original_size - len(new_date_bytes))
-                elif len(new_date_bytes) > original_size:
-                    # Truncate if too long
-                    new_date_bytes = new_date_bytes[:original_size]
-
-                # Replace the date data in the file
-                date_start = idit_pos + 8
-                date_end = date_start + original_size
-                data[date_start:date_end] = new_date_bytes
-
-                # Write the modified data back
-                with open(file_path, "wb") as f:
-                    f.write(data)
-
-                # Clean up backup if successful
-                if backup_path.exists():
-                    backup_path.unlink()
-                return True
+            # Map the file instead of reading it: only the IDIT bytes change.
+            # The date is overwritten in place with the same number of bytes, so
+            # no backup copy of the whole file is needed; if the write fails the
+            # original bytes are put back.
+            with open(file_path, "r+b") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE) as data:
+                    # The header walk jumps over the frame data, so read-ahead
+                    # would only pull in movie bytes that are never looked at
+                    if hasattr(mmap, "MADV_RANDOM"):
+                        data.madvise(mmap.MADV_RANDOM)
+
+                    # Find every IDIT chunk in one walk of the header lists
+                    idit_chunks = find_idit_chunks(data)
+                    if not idit_chunks:
+                        self.errors.append(f"No IDIT chunk found in {file_path}")
+                        return False
+
+                    # Parse current dates
+                    for _, date_data in idit_chunks:
+                        current_date_str = date_data.decode("ascii", errors="ignore")
+                        if parse_canon_date(current_date_str) is None:
+                            self.errors.append(
+                                f"Could not parse current date '{current_date_str.strip()}' in {file_path}"
+                            )
+                            return False
+
+                    # Calculate new date (use the provided timestamp)
+                    new_date_str = format_canon_date(timestamp)
+                    new_date_bytes = new_date_str.encode("ascii")
+
+                    # Patch the date data in place and flush it to disk; the new
+                    # date is padded with null bytes or truncated to match the
+                    # original chunk size
+                    try:
+                        for idit_pos, date_data in idit_chunks:
+                            original_size = len(date_data)
+                            fitted_date_bytes = new_date_bytes.ljust(
+                                original_size, b"\x00"
+                            )[:original_size]
+                            date_start = idit_pos + 8
+                            data[date_start : date_start + original_size] = (
+                                fitted_date_bytes
+                            )
+                        data.flush()
+                        os.fsync(f.fileno())
+                    except Exception as e:
+                        self.errors.append(
+                            f"RIFF modification failed for {file_path}: {e}"
+                        )
+                        # Restore the original date bytes
+                        for idit_pos, date_data in idit_chunks:
+                            date_start = idit_pos + 8
+                            data[date_start : date_start + len(date_data)] = date_data
+                        data.flush()
+                        return False
 
-            except Exception as e:
-                self.errors.append(f"RIFF modification failed for {file_path}: {e}")
-                # Restore from backup
-                if backup_path.exists():
-                    shutil.copy2(backup_path, file_path)
-                    backup_path.unlink()
-                return False
+            return True
 
         except Exception as e:
             self.errors.append(
@@ -786,6 +1209,19 @@ class MetadataTimeChanger:
             return False
 
 
+def _init_changer_worker(source_path: str, time_adjustment: str, dry_run: bool):
+    """Create the changer that a pool worker uses for all its files."""
+    global _worker_changer
+    _worker_changer = MetadataTimeChanger(source_path, time_adjustment, dry_run)
+
+
+def _process_file(file_path: Path, kind: int) -> Tuple[Dict[str, any], List[str]]:
+    """Process one media file in a pool worker, returning its new errors."""
+    errors_before = len(_worker_changer.errors)
+    result = _worker_changer.process_single_file(file_path, kind)
+    return result, _worker_changer.errors[errors_before:]
+
+
 def main():
     """Main entry point for the script."""
     parser = argparse.ArgumentParser(
@@ -813,6 +1249,12 @@ Supported time units:
         action="store_true",
         help="Show what would be changed without modifying files",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of files to process in parallel (default: CPU count)",
+    )
 
     parsed_arguments = parser.parse_args()
 
@@ -828,25 +1270,20 @@ Supported time units:
         print(f"Dry run: {'Yes' if parsed_arguments.dry_run else 'No'}")
         print()
 
-        media_files = changer.find_media_files()
-        print(f"Found {len(media_files)} media files")
-
-        if len(media_files) == 0:
-            print("No media files found to process.")
-            return
-
         print(
             f"{'Would process' if parsed_arguments.dry_run else 'Processing'} files..."
         )
         print()
 
-        # Process all files
+        # Report each file as soon as it is done
+        found_count = 0
         processed_count = 0
         metadata_updated_count = 0
         filesystem_updated_count = 0
 
-        for file_path in media_files:
-            result = changer.process_single_file(file_path)
+        for result in changer.iter_processed_files(parsed_arguments.workers):
+            found_count += 1
+            file_path = result["file_path"]
 
             if result["processed"]:
                 processed_count += 1
@@ -857,46 +1294,59 @@ Supported time units:
                 if result["filesystem_updated"]:
                     filesystem_updated_count += 1
 
-                # Show verbose output for each file
-                print(
+                # Show verbose output for each file, written in one go
+                report_lines = [
                     f"{'[DRY RUN] ' if parsed_arguments.dry_run else ''}Processing: {file_path}"
-                )
+                ]
 
                 # Show original timestamps
                 original_meta = result["original_timestamps"]["metadata"]
                 original_fs = result["original_timestamps"]["filesystem"]
 
                 if any(ts is not None for ts in original_meta.values()):
-                    print("  Original metadata timestamps:")
-                    for field, timestamp in original_meta.items():
-                        if timestamp is not None:
-                            print(f"    {field}: {timestamp}")
+                    report_lines.append("  Original metadata timestamps:")
+                    report_lines.extend(
+                        f"    {field}: {timestamp}"
+                        for field, timestamp in original_meta.items()
+                        if timestamp is not None
+                    )
 
                 if original_fs:
-                    print("  Original filesystem timestamps:")
-                    for field, timestamp in original_fs.items():
-                        print(f"    {field}: {timestamp}")
+                    report_lines.append("  Original filesystem timestamps:")
+                    report_lines.extend(
+                        f"    {field}: {timestamp}"
+                        for field, timestamp in original_fs.items()
+                    )
 
                 # Show adjusted timestamps
                 adjusted_meta = result["adjusted_timestamps"]["metadata"]
                 adjusted_fs = result["adjusted_timestamps"]["filesystem"]
 
                 if any(ts is not None for ts in adjusted_meta.values()):
-                    print("  Adjusted metadata timestamps:")
-                    for field, timestamp in adjusted_meta.items():
-                        if timestamp is not None:
-                            print(f"    {field}: {timestamp}")
+                    report_lines.append("  Adjusted metadata timestamps:")
+                    report_lines.extend(
+                        f"    {field}: {timestamp}"
+                        for field, timestamp in adjusted_meta.items()
+                        if timestamp is not None
+                    )
 
                 if adjusted_fs:
-                    print("  Adjusted filesystem timestamps:")
-                    for field, timestamp in adjusted_fs.items():
-                        print(f"    {field}: {timestamp}")
+                    report_lines.append("  Adjusted filesystem timestamps:")
+                    report_lines.extend(
+                        f"    {field}: {timestamp}"
+                        for field, timestamp in adjusted_fs.items()
+                    )
 
-                print()
+                sys.stdout.write("\n".join(report_lines) + "\n\n")
+
+        if found_count == 0:
+            print("No media files found to process.")
+            return
 
         # Show summary
         print("=" * 60)
         print(f"{'DRY RUN ' if parsed_arguments.dry_run else ''}SUMMARY:")
+        print(f"Media files found: {found_count}")
         print(f"Total files processed: {processed_count}")
         print(
             f"Files with metadata {'would be ' if parsed_arguments.dry_run else ''}updated: {metadata_updated_count}"
@@ -905,14 +1355,14 @@ Supported time units:
             f"Files with filesystem timestamps {'would be ' if parsed_arguments.dry_run else ''}updated: {filesystem_updated_count}"
         )
 
-        # Show errors in red if any
+        # Show errors in red if any (plain text when output is redirected)
         if changer.errors:
-            print()
-            print(
-                f"\033[91mERRORS ENCOUNTERED ({len(changer.errors)}):\033[0m"
-            )  # Red text
-            for error in changer.errors:
-                print(f"\033[91m  {error}\033[0m")  # Red text
+            red, reset = ("\033[91m", "\033[0m") if sys.stdout.isatty() else ("", "")
+            error_lines = [
+                f"\n{red}ERRORS ENCOUNTERED ({len(changer.errors)}):{reset}\n"
+            ]
+            error_lines.extend(f"{red}  {error}{reset}\n" for error in changer.errors)
+            sys.stdout.writelines(error_lines)
 
     except (ValueError, TimeParsingError) as error:
         print(f"Error: {error}", file=sys.stderr)
@@ -3,13 +3,19 @@
 Tests for the image_organizer module.
 """
 
+import hashlib
+import io
+import os
 import shutil
+import struct
 import tempfile
+import types
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 
+import image_organizer
 from image_organizer import ImageVideoOrganizer
 
 
@@ -127,6 +133,66 @@ class TestImageVideoOrganizer:
         assert len(png_files) == 1  # image2.PNG
         assert len(mov_files) == 1  # video2.MOV
 
+    def test_index_media_files_collects_sizes_and_kinds(self):
+        """The media index records size and image/video kind for every file."""
+        # Arrange
+        (self.test_directory / "image1.jpg").write_bytes(b"12345")
+        media_organizer = ImageVideoOrganizer(str(self.test_directory))
+
+        # Act
+        media_index = media_organizer._index_media_files()
+
+        # Assert
+        index_by_name = {
+            file_path.name: (file_size, is_image)
+            for file_path, file_size, is_image in zip(
+                media_index.paths, media_index.sizes, media_index.is_image
+            )
+        }
+        assert len(media_index.paths) == 6
+        assert index_by_name["image1.jpg"] == (5, True)
+        assert index_by_name["image2.PNG"] == (0, True)
+        assert index_by_name["video2.MOV"] == (0, False)
+
+    def test_find_media_files_skips_destination_directory(self):
+        """Files already inside the destination directory are not discovered."""
+        # Arrange
+        media_organizer = ImageVideoOrganizer(str(self.test_directory))
+        organized_date_directory = self.test_directory / "organized" / "2024_01_01"
+        organized_date_directory.mkdir(parents=True)
+        (organized_date_directory / "already_organized.jpg").touch()
+
+        # Act
+        discovered_media_files = media_organizer.find_media_files()
+
+        # Assert
+        assert len(discovered_media_files) == 6
+        assert all(
+            media_organizer.destination_path not in file_path.parents
+            for file_path in discovered_media_files
+        )
+
+    def test_find_media_files_skips_destination_given_as_relative_path(
+        self, monkeypatch
+    ):
+        """The destination is skipped however its path is spelled."""
+        # Arrange
+        monkeypatch.chdir(self.test_directory / "subdir1")
+        media_organizer = ImageVideoOrganizer(
+            str(self.test_directory), os.path.join("..", "sorted")
+        )
+        (self.test_directory / "sorted" / "already_organized.jpg").touch()
+
+        # Act
+        discovered_media_files = media_organizer.find_media_files()
+
+        # Assert
+        assert len(discovered_media_files) == 6
+        assert all(
+            file_path.name != "already_organized.jpg"
+            for file_path in discovered_media_files
+        )
+
     def test_organize_files_basic_stats(self):
         """Basic organization returns correct file count statistics."""
         # Arrange
@@ -184,6 +250,178 @@ class TestImageVideoOrganizer:
         time_difference = abs((current_time - extracted_creation_date).total_seconds())
         assert time_difference < 3600  # Within 1 hour
 
+    def test_prefetch_image_dates_uses_exiftool_batch(self, monkeypatch):
+        """Image dates come from one batched ExifTool session when available."""
+        # Arrange
+        requested_batches = []
+
+        class FakeExifToolHelper:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def get_tags(self, file_names, tags):
+                requested_batches.append(list(file_names))
+                return [
+                    {
+                        "SourceFile": file_name,
+                        "EXIF:DateTimeOriginal": "2021:06:01 12:30:00",
+                    }
+                    for file_name in file_names
+                ]
+
+        monkeypatch.setattr(
+            image_organizer,
+            "exiftool",
+            types.SimpleNamespace(ExifToolHelper=FakeExifToolHelper),
+        )
+        media_organizer = ImageVideoOrganizer(str(self.test_directory))
+        test_image_file = self.test_directory / "image1.jpg"
+
+        # Act
+        media_organizer._prefetch_image_dates(media_organizer.find_media_files())
+
+        # Assert
+        assert len(requested_batches) == 1
+        assert len(requested_batches[0]) == 3  # only the image files
+        assert media_organizer.get_creation_date(test_image_file) == datetime(
+            2021, 6, 1, 12, 30, 0
+        )
+
+    def _build_exif_tiff_block(self, date_string: bytes) -> bytes:
+        """Build little-endian EXIF TIFF data with DateTimeOriginal in the EXIF IFD."""
+        exif_ifd_offset = 8 + 2 + 12 + 4
+        date_offset = exif_ifd_offset + 2 + 12 + 4
+        return (
+            b"II*\x00"
+            + struct.pack("<L", 8)
+            + struct.pack("<HHHLL", 1, 0x8769, 4, 1, exif_ifd_offset)
+            + struct.pack("<L", 0)
+            + struct.pack("<HHHLL", 1, 0x9003, 2, len(date_string), date_offset)
+            + struct.pack("<L", 0)
+            + date_string
+        )
+
+    def test_extract_date_from_jpeg_exif_segment(self):
+        """JPEG dates are read straight from the APP1 Exif segment."""
+        # Arrange
+        media_organizer = ImageVideoOrganizer(str(self.test_directory))
+        exif_segment = b"Exif\x00\x00" + self._build_exif_tiff_block(
+            b"2021:06:01 12:30:00\x00"
+        )
+        jpeg_file = self.test_directory / "exif.jpg"
+        jpeg_file.write_bytes(
+            b"\xff\xd8"
+            + b"\xff\xe0"
+            + struct.pack(">H", 16)
+            + b"JFIF\x00" * 2
+            + b"\x00\x00\x00\x00"
+            + b"\xff\xe1"
+            + struct.pack(">H", len(exif_segment) + 2)
+            + exif_segment
+            + b"\xff\xda"
+        )
+
+        # Act
+        extracted_date = media_organizer._extract_date_from_exif_block(jpeg_file)
+
+        # Assert
+        assert extracted_date == datetime(2021, 6, 1, 12, 30, 0)
+
+    def test_read_jpeg_exif_block_stops_at_corrupt_segment_length(self):
+        """A segment length below 2 ends the walk instead of reading the file."""
+        # Arrange
+        media_organizer = ImageVideoOrganizer(str(self.test_directory))
+        jpeg_data = b"\xff\xd8" + b"\xff\xe0" + struct.pack(">H", 0) + b"\x00" * 4096
+        file_handle = io.BytesIO(jpeg_data)
+
+        # Act
+        exif_block = media_organizer._read_jpeg_exif_block(file_handle)
+
+        # Assert
+        assert exif_block is None
+        assert file_handle.tell() == 6
+
+    def test_extract_date_from_png_exif_chunk(self):
+        """PNG dates are read straight from the eXIf chunk."""
+        # Arrange
+        media_organizer = ImageVideoOrganizer(str(self.test_directory))
+        tiff_block = self._build_exif_tiff_block(b"2019:12:31 23:59:59\x00")
+        png_file = self.test_directory / "exif.png"
+        png_file.write_bytes(
+            b"\x89PNG\r\n\x1a\n"
+            + struct.pack(">L4s", 13, b"IHDR")
+            + b"\x00" * 13
+            + b"\x00" * 4
+            + struct.pack(">L4s", len(tiff_block), b"eXIf")
+            + tiff_block
+            + b"\x00" * 4
+            + struct.pack(">L4s", 0, b"IEND")
+        )
+
+        # Act
+        extracted_date = media_organizer._extract_date_from_exif_block(png_file)
+
+        # Assert
+        assert extracted_date == datetime(2019, 12, 31, 23, 59, 59)
+
+    def test_parse_exif_datetime(self):
+        """EXIF datetimes are parsed from their fixed-width layout."""
+        # Arrange
+        media_organizer = ImageVideoOrganizer(str(self.test_directory))
+
+        # Act & Assert
+        assert media_organizer._parse_exif_datetime("2024:03:15 14:30:45") == datetime(
+            2024, 3, 15, 14, 30, 45
+        )
+        assert media_organizer._parse_exif_datetime("2024-03-15 14:30:45") is None
+        assert media_organizer._parse_exif_datetime("2024:13:15 14:30:45") is None
+        assert media_organizer._parse_exif_datetime("0000:00:00 00:00:00") is None
+        assert media_organizer._parse_exif_datetime("") is None
+
+    def test_parse_video_datetime_utc(self):
+        """MediaInfo UTC datetimes are parsed from their fixed-width layout."""
+        # Arrange
+        media_organizer = ImageVideoOrganizer(str(self.test_directory))
+
+        # Act & Assert
+        assert media_organizer._parse_video_datetime(
+            "2023-07-04 08:09:10 UTC"
+        ) == datetime(2023, 7, 4, 8, 9, 10)
+        assert media_organizer._parse_video_datetime("2023-07-04T08:09:10Z") == (
+            datetime(2023, 7, 4, 8, 9, 10)
+        )
+        assert media_organizer._parse_video_datetime("garbage UTC") is None
+
+    def test_read_mp4_creation_time_from_movie_header(self):
+        """MP4 creation time is read from mvhd even when moov follows mdat."""
+        # Arrange
+        media_organizer = ImageVideoOrganizer(str(self.test_directory))
+        creation_seconds = int(
+            (datetime(2022, 5, 6, 7, 8, 9) - datetime(1904, 1, 1)).total_seconds()
+        )
+        movie_header = struct.pack(">B3xLL", 0, creation_seconds, creation_seconds)
+        movie_header += b"\x00" * 88
+        movie_atom_payload = struct.pack(">L4s", 8 + len(movie_header), b"mvhd")
+        movie_atom_payload += movie_header
+        mp4_file = self.test_directory / "clip.mp4"
+        mp4_file.write_bytes(
+            struct.pack(">L4s", 16, b"ftyp")
+            + b"isom\x00\x00\x00\x00"
+            + struct.pack(">L4s", 8 + 1000, b"mdat")
+            + b"\x00" * 1000
+            + struct.pack(">L4s", 8 + len(movie_atom_payload), b"moov")
+            + movie_atom_payload
+        )
+
+        # Act
+        extracted_date = media_organizer.get_creation_date(mp4_file)
+
+        # Assert
+        assert extracted_date == datetime(2022, 5, 6, 7, 8, 9)
+
     def test_file_system_date_extraction(self):
         """File system date extraction uses the earliest available timestamp."""
         # Arrange
@@ -264,6 +502,94 @@ class TestImageVideoOrganizer:
         # Assert
         assert first_file_hash != second_file_hash
 
+    def test_calculate_file_hash_without_file_digest(self, monkeypatch):
+        """The mmap fallback hashes the same as hashlib for regular and empty files."""
+        # Arrange
+        media_organizer = ImageVideoOrganizer(
+            str(self.test_directory), hash_algorithm="sha256"
+        )
+        hash_test_file = self.test_directory / "fallback.jpg"
+        hash_test_file.write_bytes(b"fallback content")
+        empty_test_file = self.test_directory / "empty.jpg"
+        empty_test_file.touch()
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+
+        # Act
+        fallback_hash = media_organizer.calculate_file_hash(hash_test_file)
+        empty_file_hash = media_organizer.calculate_file_hash(empty_test_file)
+
+        # Assert
+        assert fallback_hash == hashlib.sha256(b"fallback content").hexdigest()
+        assert empty_file_hash == hashlib.sha256(b"").hexdigest()
+
+    def test_calculate_file_hash_limits_blake3_threads_in_workers(self, monkeypatch):
+        """BLAKE3 is single-threaded when worker processes hash in parallel."""
+        # Arrange
+        requested_thread_counts = []
+
+        class FakeBlake3Hasher:
+            AUTO = -1
+
+            def __init__(self, max_threads=1):
+                requested_thread_counts.append(max_threads)
+
+            def update_mmap(self, file_path):
+                pass
+
+            def hexdigest(self):
+                return "0" * 64
+
+        monkeypatch.setattr(
+            image_organizer, "blake3", types.SimpleNamespace(blake3=FakeBlake3Hasher)
+        )
+        monkeypatch.setitem(
+            image_organizer._FILE_HASHER_FACTORIES, "blake3", FakeBlake3Hasher
+        )
+        hash_test_file = self.test_directory / "blake3.jpg"
+        hash_test_file.write_bytes(b"blake3 content")
+
+        # Act
+        for max_workers in (4, 1):
+            ImageVideoOrganizer(
+                str(self.test_directory),
+                hash_algorithm="blake3",
+                max_workers=max_workers,
+            ).calculate_file_hash(hash_test_file)
+
+        # Assert
+        assert requested_thread_counts == [1, FakeBlake3Hasher.AUTO]
+
+    def test_calculate_file_hash_falls_back_to_blake2b(self, monkeypatch):
+        """BLAKE2b is used when the blake3 package is not available."""
+        # Arrange
+        monkeypatch.delitem(
+            image_organizer._FILE_HASHER_FACTORIES, "blake3", raising=False
+        )
+        media_organizer = ImageVideoOrganizer(str(self.test_directory))
+        hash_test_file = self.test_directory / "blake2b.jpg"
+        hash_test_file.write_bytes(b"blake2b content")
+
+        # Act
+        file_hash = media_organizer.calculate_file_hash(hash_test_file)
+
+        # Assert
+        assert media_organizer.hash_algorithm == "blake2b"
+        assert (
+            file_hash == hashlib.blake2b(b"blake2b content", digest_size=32).hexdigest()
+        )
+
+    def test_init_invalid_copy_mode(self):
+        """Initialize organizer with an unknown copy mode should raise error."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unsupported copy mode"):
+            ImageVideoOrganizer(str(self.test_directory), copy_mode="move")
+
+    def test_init_invalid_hash_algorithm(self):
+        """Initialize organizer with an unknown hash algorithm should raise error."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unsupported hash algorithm"):
+            ImageVideoOrganizer(str(self.test_directory), hash_algorithm="md5")
+
     def test_is_duplicate_true(self):
         """Duplicate detection correctly identifies duplicates."""
         # Arrange
@@ -301,6 +627,112 @@ class TestImageVideoOrganizer:
         # Assert
         assert is_file_duplicate is False
 
+    def test_find_duplicate_candidates_buckets_by_size_and_sample(self):
+        """Only files sharing both size and sampled fingerprint need a full hash."""
+        # Arrange
+        media_organizer = ImageVideoOrganizer(str(self.test_directory))
+        first_copy = self.test_directory / "copy1.jpg"
+        second_copy = self.test_directory / "copy2.jpg"
+        same_size_file = self.test_directory / "same_size.jpg"
+        other_size_file = self.test_directory / "other_size.jpg"
+        first_copy.write_bytes(b"identical")
+        second_copy.write_bytes(b"identical")
+        same_size_file.write_bytes(b"different")
+        other_size_file.write_bytes(b"another size")
+
+        # Act
+        duplicate_candidates = media_organizer._find_duplicate_candidates(
+            [first_copy, second_copy, same_size_file, other_size_file]
+        )
+
+        # Assert
+        assert duplicate_candidates == {first_copy, second_copy}
+
+    def test_organize_files_does_not_hash_unique_sizes(self, monkeypatch):
+        """Files with a unique size are organized without a full content hash."""
+        # Arrange
+        for file_index, media_file_path in enumerate(
+            sorted(self.test_directory.rglob("*.*"))
+        ):
+            media_file_path.write_bytes(b"x" * (file_index + 1))
+        media_organizer = ImageVideoOrganizer(str(self.test_directory), max_workers=1)
+
+        def fail_hash(file_path):
+            raise AssertionError(f"unexpected full hash of {file_path}")
+
+        monkeypatch.setattr(media_organizer, "calculate_file_hash", fail_hash)
+
+        # Act
+        organization_statistics = media_organizer.organize_files()
+
+        # Assert
+        assert organization_statistics["errors"] == 0
+        assert organization_statistics["processed"] == 6
+
+    def test_cached_file_hash_reads_unchanged_file_once(self, monkeypatch):
+        """Repeated duplicate checks hash a file once until it is modified."""
+        # Arrange
+        media_organizer = ImageVideoOrganizer(str(self.test_directory))
+        cached_file = self.test_directory / "cached.jpg"
+        cached_file.write_bytes(b"original content")
+        hashed_paths = []
+        original_calculate_file_hash = media_organizer.calculate_file_hash
+
+        def counting_hash(file_path):
+            hashed_paths.append(file_path)
+            return original_calculate_file_hash(file_path)
+
+        monkeypatch.setattr(media_organizer, "calculate_file_hash", counting_hash)
+
+        # Act
+        media_organizer.is_duplicate(cached_file, set())
+        media_organizer.is_duplicate(cached_file, set())
+        media_organizer._is_same_file_content(cached_file, cached_file)
+        hashes_before_change = len(hashed_paths)
+        cached_file.write_bytes(b"modified content, now longer")
+        media_organizer.is_duplicate(cached_file, set())
+
+        # Assert
+        assert hashes_before_change == 1
+        assert len(hashed_paths) == 2
+
+    def test_file_hash_key_reuses_known_stat_result(self, monkeypatch):
+        """A stat result from the scan keys the hash cache without a new stat."""
+        # Arrange
+        media_organizer = ImageVideoOrganizer(str(self.test_directory))
+        media_index = media_organizer._index_media_files()
+        first_file_path = media_index.paths[0]
+        expected_key = media_organizer._file_hash_key(first_file_path)
+
+        def fail_stat(file_path, *args, **kwargs):
+            raise AssertionError(f"unexpected stat of {file_path}")
+
+        monkeypatch.setattr(image_organizer.os, "stat", fail_stat)
+
+        # Act
+        hash_key = media_organizer._file_hash_key(
+            first_file_path, media_index.statistics[0]
+        )
+
+        # Assert
+        assert hash_key == expected_key
+
+    def test_copy_file_preserves_content_and_times(self):
+        """Kernel-assisted copies keep the content and modification time."""
+        # Arrange
+        media_organizer = ImageVideoOrganizer(str(self.test_directory))
+        source_file_path = self.test_directory / "copy_source.jpg"
+        source_file_path.write_bytes(b"copy me" * 1000)
+        os.utime(source_file_path, (1_600_000_000, 1_600_000_000))
+        destination_file_path = self.test_directory / "copy_destination.jpg"
+
+        # Act
+        media_organizer._copy_file(source_file_path, destination_file_path)
+
+        # Assert
+        assert destination_file_path.read_bytes() == source_file_path.read_bytes()
+        assert destination_file_path.stat().st_mtime == 1_600_000_000
+
     def test_generate_unique_filename_no_conflict(self):
         """Unique filename generation when no conflict exists."""
         # Arrange
@@ -341,6 +773,29 @@ class TestImageVideoOrganizer:
         # Assert
         assert generated_unique_name == "conflict_002.jpg"
 
+    def test_generate_unique_filename_case_conflict_follows_file_system(self):
+        """Names differing only in case conflict only where case is ignored."""
+        # Arrange
+        media_organizer = ImageVideoOrganizer(str(self.test_directory))
+        destination_directory = self.test_directory / "destination"
+        destination_directory.mkdir()
+        (destination_directory / "Photo.JPG").write_bytes(b"existing content")
+        case_insensitive_file_system = (destination_directory / "photo.jpg").exists()
+
+        source_file_path = self.test_directory / "source.jpg"
+        source_file_path.write_bytes(b"new content")
+
+        # Act
+        generated_unique_name = media_organizer.generate_unique_filename(
+            destination_directory, "photo.jpg", source_file_path
+        )
+
+        # Assert
+        if case_insensitive_file_system:
+            assert generated_unique_name == "photo_002.jpg"
+        else:
+            assert generated_unique_name == "photo.jpg"
+
     def test_generate_unique_filename_duplicate_detection(self):
         """Unique filename generation detects actual duplicates."""
         # Arrange
@@ -445,6 +900,51 @@ class TestImageVideoOrganizerIntegration:
             assert len(folder_name_parts[1]) == 2  # Month
             assert len(folder_name_parts[2]) == 2  # Day
 
+    def test_organize_files_parallel_matches_sequential(self):
+        """Worker processes produce the same results as sequential analysis."""
+        # Arrange
+        output_directory = Path(tempfile.mkdtemp())
+        parallel_organizer = ImageVideoOrganizer(
+            str(self.integration_test_directory),
+            str(output_directory / "parallel"),
+            max_workers=2,
+        )
+        sequential_organizer = ImageVideoOrganizer(
+            str(self.integration_test_directory),
+            str(output_directory / "sequential"),
+            max_workers=1,
+        )
+
+        # Act
+        try:
+            parallel_results = parallel_organizer.organize_files()
+            sequential_results = sequential_organizer.organize_files()
+        finally:
+            shutil.rmtree(output_directory)
+
+        # Assert
+        assert parallel_results["errors"] == 0
+        assert parallel_results["duplicates_skipped"] == 1
+        assert parallel_results == sequential_results
+
+    def test_organize_files_hardlink_mode(self):
+        """Hard link mode links organized files to the source inode."""
+        # Arrange
+        media_organizer = ImageVideoOrganizer(
+            str(self.integration_test_directory), copy_mode="hardlink"
+        )
+        original_source_file = self.integration_test_directory / "photo1.jpg"
+
+        # Act
+        organization_results = media_organizer.organize_files()
+
+        # Assert
+        organized_photo = next(
+            (self.integration_test_directory / "organized").rglob("photo1.jpg")
+        )
+        assert organization_results["errors"] == 0
+        assert organized_photo.stat().st_ino == original_source_file.stat().st_ino
+
     def test_organize_files_skips_destination_files(self):
         """Organization skips files already in destination directory."""
         # Arrange
@@ -3,16 +3,25 @@
 Tests for the metadata_time_changer module.
 """
 
+import mmap
 import os
 import shutil
 import struct
 import tempfile
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
 
-from avi_riff_utils import find_idit_chunk, format_canon_date, parse_canon_date
+import metadata_time_changer
+from avi_riff_utils import (
+    find_idit_chunk,
+    find_idit_chunks,
+    format_canon_date,
+    parse_canon_date,
+    walk_riff_chunks,
+)
 from metadata_time_changer import MetadataTimeChanger, TimeParsingError
 
 
@@ -200,6 +209,18 @@ class TestFileDiscoveryFunctionality:
         assert len(discovered_media_files) == 8
         assert found_relative_file_paths == expected_media_files
 
+    def test_iter_media_files_streams_the_same_files(self):
+        """Iterate media files lazily yields the files find_media_files returns."""
+        # Arrange
+        changer = MetadataTimeChanger(str(self.test_directory), "+1")
+
+        # Act
+        media_file_iterator = changer.iter_media_files()
+
+        # Assert
+        assert not isinstance(media_file_iterator, list)
+        assert sorted(media_file_iterator) == sorted(changer.find_media_files())
+
     def test_find_media_files_case_insensitive_extensions(self):
         """Find media files handles case insensitive file extensions."""
         # Arrange
@@ -353,6 +374,19 @@ class TestMetadataReadingFunctionality:
         # Assert
         assert parsed_datetime is None
 
+    def test_parse_exif_datetime_string_accepts_raw_bytes(self):
+        """Parse EXIF datetime string accepts bytes and rejects bad dates."""
+        # Arrange
+        changer = MetadataTimeChanger(str(self.test_directory), "+1")
+
+        # Act
+        parsed_datetime = changer._parse_exif_datetime_string(b"2023:12:25 14:30:45")
+        invalid_month = changer._parse_exif_datetime_string("2023:13:25 14:30:45")
+
+        # Assert
+        assert parsed_datetime == datetime(2023, 12, 25, 14, 30, 45)
+        assert invalid_month is None
+
     def test_parse_video_datetime_string_utc_format(self):
         """Parse video datetime string with UTC format succeeds."""
         # Arrange
@@ -485,6 +519,26 @@ class TestTimeAdjustmentFunctionality:
         )
         assert adjusted_timestamps["EmptyField"] is None
 
+    def test_adjust_timestamps_keeps_values_that_cannot_be_adjusted(self):
+        """Adjust timestamps keeps a value that would overflow and reports it."""
+        # Arrange
+        changer = MetadataTimeChanger(str(self.test_directory), "+1d")
+        original_timestamps = {
+            "DateTime": datetime(9999, 12, 31, 12, 0, 0),
+            "DateTimeOriginal": datetime(2023, 12, 25, 14, 30, 45),
+        }
+
+        # Act
+        adjusted_timestamps = changer.adjust_timestamps(original_timestamps)
+
+        # Assert
+        assert adjusted_timestamps["DateTime"] == datetime(9999, 12, 31, 12, 0, 0)
+        assert adjusted_timestamps["DateTimeOriginal"] == datetime(
+            2023, 12, 26, 14, 30, 45
+        )
+        assert len(changer.errors) == 1
+        assert "DateTime" in changer.errors[0]
+
     def test_adjust_timestamps_complex_time_delta(self):
         """Adjust timestamps with complex time delta."""
         # Arrange
@@ -519,6 +573,55 @@ class TestTimeAdjustmentFunctionality:
         assert "adjusted_timestamps" in result
         # Errors are expected when reading metadata from fake image files
 
+    def test_process_single_file_shifts_modification_time_exactly(self):
+        """Process single file shifts the modification time to the nanosecond."""
+        # Arrange
+        test_document = self.test_directory / "document.txt"
+        test_document.write_text("test document content")
+        original_mtime_ns = 1_700_000_000_123_456_789
+        os.utime(test_document, ns=(original_mtime_ns, original_mtime_ns))
+        original_mtime_ns = os.stat(test_document).st_mtime_ns
+
+        changer = MetadataTimeChanger(str(self.test_directory), "+1d")
+
+        # Act
+        result = changer.process_single_file(test_document)
+
+        # Assert
+        assert result["filesystem_updated"] is True
+        assert os.stat(test_document).st_mtime_ns == original_mtime_ns + 86400 * 10**9
+
+    @pytest.mark.skipif(not hasattr(time, "tzset"), reason="needs time.tzset")
+    def test_process_single_file_shift_across_dst_keeps_wall_clock_time(self):
+        """Written modification time matches the reported one across a DST change."""
+        # Arrange
+        original_timezone = os.environ.get("TZ")
+        os.environ["TZ"] = "America/New_York"
+        time.tzset()
+        try:
+            test_document = self.test_directory / "document.txt"
+            test_document.write_text("test document content")
+            original_mtime = datetime(2023, 3, 10, 10, 0, 0).timestamp()
+            os.utime(test_document, (original_mtime, original_mtime))
+            changer = MetadataTimeChanger(str(self.test_directory), "+7d")
+
+            # Act
+            result = changer.process_single_file(test_document)
+            written_mtime = datetime.fromtimestamp(os.stat(test_document).st_mtime)
+        finally:
+            if original_timezone is None:
+                del os.environ["TZ"]
+            else:
+                os.environ["TZ"] = original_timezone
+            time.tzset()
+
+        # Assert
+        reported_mtime = result["adjusted_timestamps"]["filesystem"][
+            "modification_time"
+        ]
+        assert reported_mtime == datetime(2023, 3, 17, 10, 0, 0)
+        assert written_mtime == reported_mtime
+
     def test_process_single_file_handles_unsupported_format(self):
         """Process single file handles unsupported file formats gracefully."""
         # Arrange
@@ -551,6 +654,98 @@ class TestVideoMetadataFunctionality:
         """Clean up after each test."""
         shutil.rmtree(self.test_directory)
 
+    def create_mp4_file(self, file_name, mp4_seconds, extra_movie_atoms=b""):
+        """Create a minimal MP4 with mvhd, tkhd and mdhd atoms (version 0)."""
+
+        def atom(atom_type, payload):
+            return struct.pack(">L4s", 8 + len(payload), atom_type) + payload
+
+        header_times = b"\x00\x00\x00\x00" + struct.pack(
+            ">LL", mp4_seconds, mp4_seconds
+        )
+        track = atom(
+            b"trak",
+            atom(b"tkhd", header_times + b"\x00" * 16)
+            + atom(b"mdia", atom(b"mdhd", header_times + b"\x00" * 8)),
+        )
+        movie = atom(
+            b"moov",
+            atom(b"mvhd", header_times + b"\x00" * 20) + track + extra_movie_atoms,
+        )
+        mp4_file = self.test_directory / file_name
+        mp4_file.write_bytes(
+            atom(b"ftyp", b"isom") + atom(b"mdat", b"\x00" * 64) + movie
+        )
+        return mp4_file
+
+    def test_write_video_metadata_patches_mp4_header_times_in_place(self):
+        """Write video metadata patches MP4 header times without ffmpeg."""
+        # Arrange
+        changer = MetadataTimeChanger(str(self.test_directory), "+1d")
+        original_seconds = 3_000_000_000
+        test_video = self.create_mp4_file("clip.mp4", original_seconds)
+        original_size = test_video.stat().st_size
+        new_timestamp = datetime(1904, 1, 1) + timedelta(
+            seconds=original_seconds + 86400
+        )
+
+        # Act
+        result = changer.write_video_metadata_timestamps(
+            test_video, {"creation_time": new_timestamp}
+        )
+
+        # Assert
+        assert result is True
+        assert changer.errors == []
+        data = test_video.read_bytes()
+        assert len(data) == original_size
+        assert data.count(struct.pack(">LL", *[original_seconds + 86400] * 2)) == 3
+
+    @pytest.mark.skipif(not hasattr(time, "tzset"), reason="needs time.tzset")
+    def test_write_mp4_metadata_inplace_converts_local_time_to_utc(self):
+        """File system times are converted from local time before patching MP4."""
+        # Arrange
+        changer = MetadataTimeChanger(str(self.test_directory), "+1d")
+        test_video = self.create_mp4_file("local.mp4", 3_000_000_000)
+        original_timezone = os.environ.get("TZ")
+        os.environ["TZ"] = "America/New_York"
+        time.tzset()
+        try:
+            # Act
+            result = changer.write_mp4_metadata_inplace(
+                test_video, datetime(2023, 7, 1, 12, 0, 0), naive_time_is_local=True
+            )
+        finally:
+            if original_timezone is None:
+                del os.environ["TZ"]
+            else:
+                os.environ["TZ"] = original_timezone
+            time.tzset()
+
+        # Assert
+        expected_seconds = int(
+            (datetime(2023, 7, 1, 16, 0, 0) - datetime(1904, 1, 1)).total_seconds()
+        )
+        assert result is True
+        data = test_video.read_bytes()
+        assert data.count(struct.pack(">LL", *[expected_seconds] * 2)) == 3
+
+    def test_write_video_metadata_uses_ffmpeg_for_mp4_with_date_tag(self):
+        """Write video metadata leaves MP4 files with a ©day tag to ffmpeg."""
+        # Arrange
+        changer = MetadataTimeChanger(str(self.test_directory), "+1d")
+        date_tag = struct.pack(">L4s", 12, b"\xa9day") + b"2006"
+        user_data = struct.pack(">L4s", 8 + len(date_tag), b"udta") + date_tag
+        test_video = self.create_mp4_file("tagged.mp4", 3_000_000_000, user_data)
+        original_data = test_video.read_bytes()
+
+        # Act
+        result = changer.write_mp4_metadata_inplace(test_video, datetime(2006, 8, 29))
+
+        # Assert
+        assert result is None
+        assert test_video.read_bytes() == original_data
+
     def test_write_video_metadata_timestamps_requires_ffmpeg(self):
         """Write video metadata timestamps requires ffmpeg binary."""
         # Arrange
@@ -650,6 +845,61 @@ class TestIntegrationFunctionality:
         assert len(image_files) == 2
         assert len(video_files) == 2
 
+    def test_process_all_matches_sequential_processing(self):
+        """Process all in parallel gives the same results as one file at a time."""
+        # Arrange
+        changer = MetadataTimeChanger(str(self.test_directory), "+10d", dry_run=True)
+
+        # Act
+        parallel_results = changer.process_all(workers=2)
+        sequential_results = changer.process_all(workers=1)
+
+        # Assert
+        assert [result["file_path"] for result in parallel_results] == [
+            result["file_path"] for result in sequential_results
+        ]
+        assert [result["adjusted_timestamps"] for result in parallel_results] == [
+            result["adjusted_timestamps"] for result in sequential_results
+        ]
+        assert all(result["processed"] for result in parallel_results)
+
+    def test_iter_processed_files_streams_while_walking(self):
+        """The first result arrives before the walk has submitted every file."""
+        # Arrange
+        for clip_index in range(20):
+            (self.test_directory / "videos" / f"clip{clip_index}.avi").write_bytes(
+                b"fake video"
+            )
+        changer = MetadataTimeChanger(str(self.test_directory), "+1d", dry_run=True)
+        walked_files = []
+        original_iter_media_file_kinds = changer._iter_media_file_kinds
+
+        def recording_iter_media_file_kinds():
+            for file_path, kind in original_iter_media_file_kinds():
+                walked_files.append(file_path)
+                yield file_path, kind
+
+        changer._iter_media_file_kinds = recording_iter_media_file_kinds
+
+        # Act
+        processed_files = changer.iter_processed_files(workers=2)
+        first_result = next(processed_files)
+        walked_before_first_result = len(walked_files)
+        remaining_results = list(processed_files)
+
+        # Assert
+        assert first_result["file_path"] == walked_files[0]
+        assert walked_before_first_result <= 4
+        assert len(remaining_results) == len(walked_files) - 1 == 23
+
+    def test_process_all_does_not_fork_photo_workers(self):
+        """Photo workers are not forked from the process running video threads."""
+        # Act
+        start_method = metadata_time_changer._PROCESS_POOL_CONTEXT.get_start_method()
+
+        # Assert
+        assert start_method != "fork"
+
     def test_time_adjustment_consistency_across_file_types(self):
         """Time adjustment is consistent across different file types."""
         # Arrange
@@ -747,6 +997,21 @@ class TestRIFFPreservingAVIFunctionality:
         assert date_data is not None
         assert b"MON AUG 28 14:14:28 2006" in date_data
 
+    def test_find_idit_chunk_reads_memory_mapped_file(self):
+        """Find IDIT chunk directly in a memory-mapped file without copying it."""
+        # Arrange
+        test_avi = self.test_directory / "test_with_idit.avi"
+        expected_chunk = find_idit_chunk(test_avi.read_bytes())
+
+        # Act
+        with open(test_avi, "rb") as avi_file:
+            with mmap.mmap(avi_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                idit_pos, date_data = find_idit_chunk(data)
+
+        # Assert
+        assert (idit_pos, date_data) == expected_chunk
+        assert isinstance(date_data, bytes)
+
     def test_find_idit_chunk_not_found(self):
         """Find IDIT chunk returns None when chunk is not present."""
         # Arrange
@@ -760,6 +1025,81 @@ class TestRIFFPreservingAVIFunctionality:
         assert idit_pos is None
         assert date_data is None
 
+    def test_write_avi_metadata_updates_every_idit_chunk(self):
+        """Write AVI metadata rewrites all IDIT chunks found in one walk."""
+        # Arrange
+        idit_payload = b"MON AUG 28 14:14:28 2006\x00\x00"
+        idit_chunk = b"IDIT" + struct.pack("<L", len(idit_payload)) + idit_payload
+        list_content = b"INFO" + idit_chunk + idit_chunk
+        riff_content = (
+            b"AVI " + b"LIST" + struct.pack("<L", len(list_content)) + list_content
+        )
+        test_avi = self.test_directory / "two_idit.avi"
+        test_avi.write_bytes(
+            b"RIFF" + struct.pack("<L", len(riff_content)) + riff_content
+        )
+        changer = MetadataTimeChanger(str(self.test_directory), "+1d")
+        new_timestamp = datetime(2006, 8, 29, 14, 14, 28)
+
+        # Act
+        result = changer.write_avi_metadata_safe_inplace_modify(test_avi, new_timestamp)
+
+        # Assert
+        assert result is True
+        idit_chunks = find_idit_chunks(test_avi.read_bytes())
+        assert len(idit_chunks) == 2
+        assert all(
+            parse_canon_date(date_data.decode("ascii")) == new_timestamp
+            for _, date_data in idit_chunks
+        )
+
+    def test_find_idit_chunk_walks_riff_structure(self):
+        """Find IDIT chunk inside the hdrl list, ignoring IDIT bytes in other chunks."""
+        # Arrange
+        junk_payload = b"IDIT" + b"\x00" * 3  # Odd size, padded to 8 bytes
+        idit_payload = b"SAT JAN 01 10:00:00 2000\x00\x00"
+        hdrl_content = (
+            b"hdrl"
+            + b"JUNK"
+            + struct.pack("<L", len(junk_payload))
+            + junk_payload
+            + b"\x00"
+            + b"IDIT"
+            + struct.pack("<L", len(idit_payload))
+            + idit_payload
+        )
+        movi_content = (
+            b"movi" + b"00dc" + struct.pack("<L", 8) + b"IDIT\x00\x00\x00\x00"
+        )
+        riff_content = (
+            b"AVI "
+            + b"LIST"
+            + struct.pack("<L", len(movi_content))
+            + movi_content
+            + b"LIST"
+            + struct.pack("<L", len(hdrl_content))
+            + hdrl_content
+        )
+        data = b"RIFF" + struct.pack("<L", len(riff_content)) + riff_content
+
+        # Act
+        idit_pos, date_data = find_idit_chunk(data)
+
+        # Assert
+        assert idit_pos == data.rindex(b"IDIT" + struct.pack("<L", 26))
+        assert date_data == idit_payload
+
+    def test_walk_riff_chunks_yields_headers_in_file_order(self):
+        """Walk RIFF chunks yields LIST chunks and their children in file order."""
+        # Arrange
+        data = (self.test_directory / "test_with_idit.avi").read_bytes()
+
+        # Act
+        chunks = list(walk_riff_chunks(data))
+
+        # Assert
+        assert chunks == [(b"LIST", 12, 50), (b"IDIT", 24, 26)]
+
     def test_parse_canon_date_valid_format(self):
         """Parse Canon date format successfully."""
         # Arrange
@@ -789,6 +1129,14 @@ class TestRIFFPreservingAVIFunctionality:
         assert parsed_date is not None
         assert parsed_date.year == 2006
 
+    def test_parse_canon_date_case_insensitive(self):
+        """Parse Canon date format regardless of the letter case of names."""
+        # Act
+        parsed_date = parse_canon_date("Mon Aug 28 14:14:28 2006")
+
+        # Assert
+        assert parsed_date == datetime(2006, 8, 28, 14, 14, 28)
+
     def test_parse_canon_date_invalid_format(self):
         """Parse Canon date format with invalid format returns None."""
         # Arrange
@@ -832,6 +1180,31 @@ class TestRIFFPreservingAVIFunctionality:
         assert idit_pos is not None
         assert b"WED AUG 30 14:14:28 2006" in date_data
 
+    def test_riff_preserving_modify_patches_only_date_bytes(self):
+        """RIFF-preserving AVI modification only changes the IDIT date bytes."""
+        # Arrange
+        changer = MetadataTimeChanger(str(self.test_directory), "+2d", dry_run=False)
+        test_avi = self.test_directory / "test_with_idit.avi"
+        original_data = test_avi.read_bytes()
+
+        # Act
+        result = changer.write_avi_metadata_safe_inplace_modify(
+            test_avi, datetime(2006, 8, 30, 14, 14, 28)
+        )
+
+        # Assert
+        assert result is True
+        modified_data = test_avi.read_bytes()
+        date_start = original_data.index(b"MON AUG 28")
+        assert len(modified_data) == len(original_data)
+        assert modified_data[:date_start] == original_data[:date_start]
+        assert modified_data[date_start + 26 :] == original_data[date_start + 26 :]
+        assert sorted(p.name for p in self.test_directory.iterdir()) == [
+            "dummy.jpg",
+            "test_with_idit.avi",
+            "test_without_idit.avi",
+        ]
+
     def test_metadata_time_changer_helper_methods(self):
         """MetadataTimeChanger helper methods work correctly."""
         # Arrange